@@ -2,7 +2,7 @@ import os
 import sys
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 from alembic import context
 
@@ -27,6 +27,11 @@ config.set_main_option("sqlalchemy.url", settings.get_database_direct_url)
 
 target_metadata = Base.metadata
 
+# Session-level advisory lock serializing concurrent migrators (e.g. several
+# app containers starting at once). Taken before alembic reads the current
+# revision, so a waiting node sees the upgraded head once it gets the lock.
+MIGRATION_LOCK_KEY = "sinas-alembic"
+
 
 def include_object(object, name, type_, reflected, compare_to):
     """
@@ -62,14 +67,23 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            include_object=include_object,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        # Commit right away so alembic still manages its own transaction; the
+        # lock outlives it and is released explicitly (or when the connection closes)
+        connection.execute(text("SELECT pg_advisory_lock(hashtext(:key))"), {"key": MIGRATION_LOCK_KEY})
+        connection.commit()
+
+        try:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                include_object=include_object,
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": MIGRATION_LOCK_KEY})
+            connection.commit()
 
 
 if context.is_offline_mode():
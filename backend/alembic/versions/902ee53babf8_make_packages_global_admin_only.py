@@ -34,20 +34,9 @@ def upgrade() -> None:
     # Add unique constraint on package_name only
     op.create_unique_constraint("uix_package_name", "installed_packages", ["package_name"])
 
-    # Drop existing installed_by foreign key to recreate it as nullable
-    op.drop_constraint(
-        "installed_packages_installed_by_fkey", "installed_packages", type_="foreignkey"
-    )
-
-    # Recreate installed_by as nullable foreign key (for audit trail)
+    # Make installed_by nullable (for audit trail). Dropping NOT NULL is a
+    # catalog-only change; the existing FK stays valid and needs no re-check.
     op.alter_column("installed_packages", "installed_by", existing_type=sa.UUID(), nullable=True)
-    op.create_foreign_key(
-        "installed_packages_installed_by_fkey",
-        "installed_packages",
-        "users",
-        ["installed_by"],
-        ["id"],
-    )
 
 
 def downgrade() -> None:
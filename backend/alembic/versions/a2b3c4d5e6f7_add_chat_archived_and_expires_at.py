@@ -19,18 +19,65 @@ depends_on = None
 def upgrade() -> None:
     op.add_column(
         "chats",
-        sa.Column("archived", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column("archived", sa.Boolean(), server_default=sa.text("false"), nullable=False),
     )
     op.add_column(
         "chats",
         sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
     )
-    op.create_index(op.f("ix_chats_archived"), "chats", ["archived"])
-    op.create_index(op.f("ix_chats_expires_at"), "chats", ["expires_at"])
+    # Build indexes concurrently (outside the migration transaction) so writes
+    # to chats are not blocked while the table is scanned.
+    # archived is mostly false: index only the archived minority, and serve the
+    # hot "list my non-archived chats" query with a partial (user_id, updated_at).
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_chats_archived"),
+            "chats",
+            ["archived"],
+            postgresql_where=sa.text("archived = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_chats_user_id_updated_at_active",
+            "chats",
+            ["user_id", "updated_at"],
+            postgresql_where=sa.text("archived = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Compact BRIN over the (mostly NULL, insert-ordered) TTL column for
+        # the cleanup_expired_chats sweep.
+        op.create_index(
+            op.f("ix_chats_expires_at"),
+            "chats",
+            ["expires_at"],
+            postgresql_using="brin",
+            postgresql_where=sa.text("expires_at IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_chats_expires_at"), table_name="chats")
-    op.drop_index(op.f("ix_chats_archived"), table_name="chats")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_chats_expires_at"),
+            table_name="chats",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_chats_user_id_updated_at_active",
+            table_name="chats",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            op.f("ix_chats_archived"),
+            table_name="chats",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
     op.drop_column("chats", "expires_at")
     op.drop_column("chats", "archived")
@@ -0,0 +1,69 @@
+"""Replace full chats indexes with partial / BRIN indexes
+
+Revision ID: c5h6a7t8i9x0
+Revises: j1s2o3n4b5e6
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5h6a7t8i9x0"
+down_revision = "j1s2o3n4b5e6"
+branch_labels = None
+depends_on = None
+
+
+def _index_is_partial(name: str) -> bool:
+    indexdef = op.get_bind().execute(
+        sa.text("SELECT indexdef FROM pg_indexes WHERE indexname = :name"), {"name": name}
+    ).scalar()
+    return indexdef is not None and " WHERE " in indexdef
+
+
+def upgrade() -> None:
+    # a2b3c4d5e6f7 now creates these partial indexes directly; databases
+    # migrated before that still carry full btrees on archived and expires_at.
+    with op.get_context().autocommit_block():
+        if not _index_is_partial("ix_chats_archived"):
+            op.drop_index(
+                "ix_chats_archived",
+                table_name="chats",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+            op.create_index(
+                "ix_chats_archived",
+                "chats",
+                ["archived"],
+                postgresql_where=sa.text("archived = true"),
+                postgresql_concurrently=True,
+            )
+        if not _index_is_partial("ix_chats_expires_at"):
+            op.drop_index(
+                "ix_chats_expires_at",
+                table_name="chats",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+            op.create_index(
+                "ix_chats_expires_at",
+                "chats",
+                ["expires_at"],
+                postgresql_using="brin",
+                postgresql_where=sa.text("expires_at IS NOT NULL"),
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            "ix_chats_user_id_updated_at_active",
+            "chats",
+            ["user_id", "updated_at"],
+            postgresql_where=sa.text("archived = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # Leave the indexes in place: a2b3c4d5e6f7 owns them on fresh installs.
+    pass
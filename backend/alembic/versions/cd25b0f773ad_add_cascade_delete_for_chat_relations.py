@@ -14,49 +14,44 @@ down_revision = "255094362009"
 branch_labels = None
 depends_on = None
 
+# (table, constraint, ondelete) for every FK pointing at chats.id
+CHAT_FKS = [
+    ("messages", "messages_chat_id_fkey", "CASCADE"),
+    ("pending_tool_approvals", "pending_tool_approvals_chat_id_fkey", "CASCADE"),
+    ("executions", "executions_chat_id_fkey", "SET NULL"),
+]
+
+
+def _recreate_chat_fks(with_ondelete: bool) -> None:
+    """
+    Re-create the chat FKs without blocking writes.
+
+    Constraints are added NOT VALID (brief metadata lock only) and validated
+    after the migration transaction commits, so the row scan runs under a
+    SHARE UPDATE EXCLUSIVE lock that allows concurrent DML.
+    """
+    for table, name, ondelete in CHAT_FKS:
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name,
+            table,
+            "chats",
+            ["chat_id"],
+            ["id"],
+            ondelete=ondelete if with_ondelete else None,
+            postgresql_not_valid=True,
+        )
+
+    with op.get_context().autocommit_block():
+        for table, name, _ in CHAT_FKS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
 
 def upgrade() -> None:
-    # Update messages.chat_id to CASCADE on delete
-    op.drop_constraint("messages_chat_id_fkey", "messages", type_="foreignkey")
-    op.create_foreign_key(
-        "messages_chat_id_fkey", "messages", "chats", ["chat_id"], ["id"], ondelete="CASCADE"
-    )
-
-    # Update pending_tool_approvals.chat_id to CASCADE on delete
-    op.drop_constraint(
-        "pending_tool_approvals_chat_id_fkey", "pending_tool_approvals", type_="foreignkey"
-    )
-    op.create_foreign_key(
-        "pending_tool_approvals_chat_id_fkey",
-        "pending_tool_approvals",
-        "chats",
-        ["chat_id"],
-        ["id"],
-        ondelete="CASCADE",
-    )
-
-    # Update executions.chat_id to SET NULL on delete
-    op.drop_constraint("executions_chat_id_fkey", "executions", type_="foreignkey")
-    op.create_foreign_key(
-        "executions_chat_id_fkey", "executions", "chats", ["chat_id"], ["id"], ondelete="SET NULL"
-    )
+    # messages/pending_tool_approvals CASCADE, executions SET NULL on chat delete
+    _recreate_chat_fks(with_ondelete=True)
 
 
 def downgrade() -> None:
     # Revert to no ondelete behavior
-    op.drop_constraint("messages_chat_id_fkey", "messages", type_="foreignkey")
-    op.create_foreign_key("messages_chat_id_fkey", "messages", "chats", ["chat_id"], ["id"])
-
-    op.drop_constraint(
-        "pending_tool_approvals_chat_id_fkey", "pending_tool_approvals", type_="foreignkey"
-    )
-    op.create_foreign_key(
-        "pending_tool_approvals_chat_id_fkey",
-        "pending_tool_approvals",
-        "chats",
-        ["chat_id"],
-        ["id"],
-    )
-
-    op.drop_constraint("executions_chat_id_fkey", "executions", type_="foreignkey")
-    op.create_foreign_key("executions_chat_id_fkey", "executions", "chats", ["chat_id"], ["id"])
+    _recreate_chat_fks(with_ondelete=False)
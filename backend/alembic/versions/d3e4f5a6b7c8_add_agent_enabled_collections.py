@@ -7,6 +7,7 @@ Create Date: 2026-02-16
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -17,7 +18,7 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column('agents', sa.Column('enabled_collections', sa.JSON(), server_default='[]', nullable=False))
+    op.add_column('agents', sa.Column('enabled_collections', postgresql.JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False))
 
 
 def downgrade() -> None:
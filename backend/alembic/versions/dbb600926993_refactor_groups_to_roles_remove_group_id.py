@@ -37,27 +37,26 @@ def upgrade() -> None:
     op.drop_column("templates", "group_id")
     op.drop_column("webhooks", "group_id")
 
-    # Step 2: Rename tables
-    op.rename_table("groups", "roles")
-    op.rename_table("group_members", "user_roles")
-    op.rename_table("group_permissions", "role_permissions")
-
-    # Step 3: Rename indexes and constraints
-    # groups table indexes
-    op.execute("ALTER INDEX ix_groups_name RENAME TO ix_roles_name")
-    op.execute("ALTER INDEX ix_groups_email_domain RENAME TO ix_roles_email_domain")
-    op.execute("ALTER INDEX ix_groups_external_group_id RENAME TO ix_roles_external_group_id")
-
-    # group_members table indexes and constraints
-    op.execute("ALTER INDEX ix_group_members_group_id RENAME TO ix_user_roles_role_id")
-    op.execute("ALTER INDEX ix_group_members_user_id RENAME TO ix_user_roles_user_id")
-
-    # group_permissions table indexes and constraints
-    op.execute("ALTER INDEX ix_group_permissions_group_id RENAME TO ix_role_permissions_role_id")
+    # Step 2 + 3: Rename tables, then their indexes. These are independent
+    # catalog-only operations, so send them as one batch (one round-trip).
     op.execute(
-        "ALTER INDEX ix_group_permissions_permission_key RENAME TO ix_role_permissions_permission_key"
+        """
+        ALTER TABLE groups RENAME TO roles;
+        ALTER TABLE group_members RENAME TO user_roles;
+        ALTER TABLE group_permissions RENAME TO role_permissions;
+
+        ALTER INDEX ix_groups_name RENAME TO ix_roles_name;
+        ALTER INDEX ix_groups_email_domain RENAME TO ix_roles_email_domain;
+        ALTER INDEX ix_groups_external_group_id RENAME TO ix_roles_external_group_id;
+
+        ALTER INDEX ix_group_members_group_id RENAME TO ix_user_roles_role_id;
+        ALTER INDEX ix_group_members_user_id RENAME TO ix_user_roles_user_id;
+
+        ALTER INDEX ix_group_permissions_group_id RENAME TO ix_role_permissions_role_id;
+        ALTER INDEX ix_group_permissions_permission_key RENAME TO ix_role_permissions_permission_key;
+        ALTER INDEX ix_group_permission_unique RENAME TO ix_role_permission_unique;
+        """
     )
-    op.execute("ALTER INDEX ix_group_permission_unique RENAME TO ix_role_permission_unique")
 
     # Step 4: Update column references in renamed tables
     # user_roles.group_id -> user_roles.role_id
@@ -74,22 +73,23 @@ def downgrade() -> None:
     op.alter_column("user_roles", "role_id", new_column_name="group_id")
     op.alter_column("role_permissions", "role_id", new_column_name="group_id")
 
-    # Step 2: Rename indexes back
-    op.execute("ALTER INDEX ix_role_permission_unique RENAME TO ix_group_permission_unique")
+    # Step 2 + 3: Rename indexes and tables back in a single batch
     op.execute(
-        "ALTER INDEX ix_role_permissions_permission_key RENAME TO ix_group_permissions_permission_key"
+        """
+        ALTER INDEX ix_role_permission_unique RENAME TO ix_group_permission_unique;
+        ALTER INDEX ix_role_permissions_permission_key RENAME TO ix_group_permissions_permission_key;
+        ALTER INDEX ix_role_permissions_role_id RENAME TO ix_group_permissions_group_id;
+        ALTER INDEX ix_user_roles_user_id RENAME TO ix_group_members_user_id;
+        ALTER INDEX ix_user_roles_role_id RENAME TO ix_group_members_group_id;
+        ALTER INDEX ix_roles_external_group_id RENAME TO ix_groups_external_group_id;
+        ALTER INDEX ix_roles_email_domain RENAME TO ix_groups_email_domain;
+        ALTER INDEX ix_roles_name RENAME TO ix_groups_name;
+
+        ALTER TABLE role_permissions RENAME TO group_permissions;
+        ALTER TABLE user_roles RENAME TO group_members;
+        ALTER TABLE roles RENAME TO groups;
+        """
     )
-    op.execute("ALTER INDEX ix_role_permissions_role_id RENAME TO ix_group_permissions_group_id")
-    op.execute("ALTER INDEX ix_user_roles_user_id RENAME TO ix_group_members_user_id")
-    op.execute("ALTER INDEX ix_user_roles_role_id RENAME TO ix_group_members_group_id")
-    op.execute("ALTER INDEX ix_roles_external_group_id RENAME TO ix_groups_external_group_id")
-    op.execute("ALTER INDEX ix_roles_email_domain RENAME TO ix_groups_email_domain")
-    op.execute("ALTER INDEX ix_roles_name RENAME TO ix_groups_name")
-
-    # Step 3: Rename tables back
-    op.rename_table("role_permissions", "group_permissions")
-    op.rename_table("user_roles", "group_members")
-    op.rename_table("roles", "groups")
 
     # Step 4: Add back group_id columns
     op.add_column("webhooks", sa.Column("group_id", sa.UUID(), nullable=True))
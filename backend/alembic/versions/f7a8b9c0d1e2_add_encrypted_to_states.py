@@ -17,17 +17,45 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+BACKFILL_BATCH_SIZE = 10000
+
+
 def upgrade() -> None:
-    op.add_column(
-        "states",
-        sa.Column("encrypted", sa.Boolean(), nullable=False, server_default="false"),
-    )
-    op.add_column(
-        "states",
-        sa.Column("encrypted_value", sa.Text(), nullable=True),
+    # Single ALTER for both columns. encrypted starts out nullable so adding
+    # it is metadata-only; the default only applies to rows inserted from now on.
+    op.execute(
+        "ALTER TABLE states "
+        "ADD COLUMN encrypted boolean, "
+        "ADD COLUMN encrypted_value text"
     )
+    op.execute("ALTER TABLE states ALTER COLUMN encrypted SET DEFAULT false")
+
+    # Backfill existing rows in short, separately committed ctid batches, then
+    # prove NOT NULL with a NOT VALID check constraint validated under a
+    # SHARE UPDATE EXCLUSIVE lock, so SET NOT NULL can skip the table scan.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            result = bind.execute(
+                sa.text(
+                    "UPDATE states SET encrypted = false "
+                    "WHERE ctid = ANY(ARRAY("
+                    "SELECT ctid FROM states WHERE encrypted IS NULL LIMIT :batch_size"
+                    "))"
+                ),
+                {"batch_size": BACKFILL_BATCH_SIZE},
+            )
+            if result.rowcount == 0:
+                break
+
+        op.execute(
+            "ALTER TABLE states ADD CONSTRAINT states_encrypted_not_null "
+            "CHECK (encrypted IS NOT NULL) NOT VALID"
+        )
+        op.execute("ALTER TABLE states VALIDATE CONSTRAINT states_encrypted_not_null")
+        op.execute("ALTER TABLE states ALTER COLUMN encrypted SET NOT NULL")
+        op.execute("ALTER TABLE states DROP CONSTRAINT states_encrypted_not_null")
 
 
 def downgrade() -> None:
-    op.drop_column("states", "encrypted_value")
-    op.drop_column("states", "encrypted")
+    op.execute("ALTER TABLE states DROP COLUMN encrypted_value, DROP COLUMN encrypted")
@@ -0,0 +1,49 @@
+"""Store agents.enabled_collections as jsonb
+
+Revision ID: j1s2o3n4b5e6
+Revises: r1e2m3g4r5p6
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "j1s2o3n4b5e6"
+down_revision = "r1e2m3g4r5p6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fresh installs already get jsonb from d3e4f5a6b7c8; only convert
+    # databases that were created while the column was still plain json.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'agents'
+                  AND column_name = 'enabled_collections'
+                  AND data_type = 'json'
+            ) THEN
+                ALTER TABLE agents
+                    ALTER COLUMN enabled_collections DROP DEFAULT,
+                    ALTER COLUMN enabled_collections TYPE jsonb
+                        USING enabled_collections::jsonb,
+                    ALTER COLUMN enabled_collections SET DEFAULT '[]'::jsonb;
+            END IF;
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE agents
+            ALTER COLUMN enabled_collections DROP DEFAULT,
+            ALTER COLUMN enabled_collections TYPE json
+                USING enabled_collections::json,
+            ALTER COLUMN enabled_collections SET DEFAULT '[]'::json
+        """
+    )
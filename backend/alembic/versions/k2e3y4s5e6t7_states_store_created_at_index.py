@@ -0,0 +1,34 @@
+"""Index states by (store_id, created_at, id) for keyset pagination
+
+Revision ID: k2e3y4s5e6t7
+Revises: s1t2a3g4s5j6
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "k2e3y4s5e6t7"
+down_revision = "s1t2a3g4s5j6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_states_store_created_at_id",
+            "states",
+            ["store_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_states_store_created_at_id",
+            table_name="states",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
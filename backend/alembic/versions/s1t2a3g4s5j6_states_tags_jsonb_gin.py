@@ -0,0 +1,55 @@
+"""Store states.tags as jsonb with a GIN index for containment filters
+
+Revision ID: s1t2a3g4s5j6
+Revises: c5h6a7t8i9x0
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "s1t2a3g4s5j6"
+down_revision = "c5h6a7t8i9x0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tag filters use @>, which plain json doesn't support and can't be indexed
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'states'
+                  AND column_name = 'tags'
+                  AND data_type = 'json'
+            ) THEN
+                ALTER TABLE states
+                    ALTER COLUMN tags TYPE jsonb USING tags::jsonb;
+            END IF;
+        END $$;
+        """
+    )
+    # Build the index without blocking writes to states
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_states_tags",
+            "states",
+            ["tags"],
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_states_tags",
+            table_name="states",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ALTER TABLE states ALTER COLUMN tags TYPE json USING tags::json")
@@ -0,0 +1,47 @@
+"""Index templates by created_at (and owner) for keyset pagination
+
+Revision ID: t3m4p5l6i7s8
+Revises: k2e3y4s5e6t7
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "t3m4p5l6i7s8"
+down_revision = "k2e3y4s5e6t7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_templates_created_at_id",
+            "templates",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_templates_user_created_at_id",
+            "templates",
+            ["user_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_templates_user_created_at_id",
+            table_name="templates",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_templates_created_at_id",
+            table_name="templates",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -4,14 +4,14 @@ from typing import Optional
 from fastapi import Header, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.manifest import Manifest
+from app.services.manifest_cache import ManifestContext, get_manifest_cached
 
 
 async def get_manifest_context(
     db: AsyncSession,
     x_application: Optional[str] = Header(None),
     app_query: Optional[str] = Query(None, alias="app"),
-) -> Optional[Manifest]:
+) -> Optional[ManifestContext]:
     """Resolve manifest from X-Application header or ?app= query param.
 
     Returns None if neither provided; raises 404 if provided but not found.
@@ -20,18 +20,18 @@ async def get_manifest_context(
     if not app_ref:
         return None
 
-    if "/" not in app_ref:
+    namespace, sep, name = app_ref.partition("/")
+    if not sep:
         raise HTTPException(status_code=400, detail="Manifest reference must be in 'namespace/name' format")
 
-    namespace, name = app_ref.split("/", 1)
-    manifest = await Manifest.get_by_name(db, namespace=namespace, name=name)
+    manifest = await get_manifest_cached(db, namespace, name)
     if not manifest:
         raise HTTPException(status_code=404, detail=f"Manifest '{app_ref}' not found")
 
     return manifest
 
 
-def get_namespace_filter(manifest: Optional[Manifest], resource_type: str) -> Optional[list[str]]:
+def get_namespace_filter(manifest: Optional[ManifestContext], resource_type: str) -> Optional[list[str]]:
     """Return namespace list from manifest.exposed_namespaces for a resource type.
 
     Returns None when no manifest context (no filtering).
@@ -42,7 +42,7 @@ def get_namespace_filter(manifest: Optional[Manifest], resource_type: str) -> Op
     if manifest is None:
         return None
 
-    exposed = manifest.exposed_namespaces or {}
+    exposed = manifest.exposed_namespaces
     if resource_type not in exposed:
         return []
 
@@ -1,18 +1,19 @@
 """Authentication endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import (
     create_access_token,
-    create_otp_session,
+    create_otp_session_record,
     create_refresh_token,
     get_current_user,
     get_current_user_with_permissions,
     get_user_by_email,
     normalize_email,
     revoke_refresh_token,
+    send_otp_email,
     set_permission_used,
     validate_refresh_token,
     verify_otp_code,
@@ -41,32 +42,32 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest, http_request: Request, db: AsyncSession = Depends(get_db)):
+async def login(
+    request: LoginRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
     """
     Initiate login by sending OTP to email.
 
     User must exist - users are created by admins only.
+    The email is sent in the background after the response is returned.
     """
     await rate_limit_by_ip(http_request, "login", settings.rate_limit_login_ip_max, settings.rate_limit_window_seconds)
     await rate_limit_by_value(request.email, "login:email", settings.rate_limit_login_email_max, settings.rate_limit_window_seconds)
 
     # Check if user exists - no auto-provisioning
-    result = await db.execute(select(User).where(User.email == normalize_email(request.email)))
-    user = result.scalar_one_or_none()
-    if not user:
+    result = await db.execute(select(User.id).where(User.email == normalize_email(request.email)))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User not found. Contact your administrator.",
         )
 
-    # Create OTP session and send email
-    try:
-        otp_session = await create_otp_session(db, request.email)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Failed to send OTP email: {str(e)}",
-        )
+    # Create OTP session, then send the email off the request path
+    otp_session = await create_otp_session_record(db, request.email)
+    background_tasks.add_task(send_otp_email, otp_session.id, request.email)
 
     return LoginResponse(message="OTP sent to your email", session_id=otp_session.id)
 
@@ -174,23 +175,35 @@ async def get_current_user_info(
     """Get current authenticated user info with roles."""
     set_permission_used(request, "sinas.users.read:own")
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Reuse the user already loaded by the auth dependency; otherwise load
+    # only the columns AuthUserResponse needs (no ORM instance)
+    user_row = getattr(request.state, "current_user", None)
+    if user_row is None or str(user_row.id) != user_id:
+        result = await db.execute(
+            select(User.id, User.email, User.last_login_at, User.created_at).where(
+                User.id == user_id
+            )
+        )
+        user_row = result.one_or_none()
 
-    if not user:
+    if not user_row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     # Get user's roles (single query with join)
     roles_result = await db.execute(
         select(Role.name)
         .join(UserRole, UserRole.role_id == Role.id)
-        .where(UserRole.user_id == user.id, UserRole.active == True)
+        .where(UserRole.user_id == user_row.id, UserRole.active == True)
     )
     role_names = [r[0] for r in roles_result.all()]
 
-    resp = AuthUserResponse.model_validate(user)
-    resp.roles = role_names
-    return resp
+    return AuthUserResponse.model_construct(
+        id=user_row.id,
+        email=user_row.email,
+        last_login_at=user_row.last_login_at,
+        created_at=user_row.created_at,
+        roles=role_names,
+    )
 
 
 @router.post("/check-permissions", response_model=PermissionCheckResponse)
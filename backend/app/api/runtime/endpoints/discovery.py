@@ -1,26 +1,98 @@
 """Runtime discovery endpoints — list resources visible to the current user, optionally filtered by manifest context."""
-from typing import Optional
+import hashlib
+import json
+import logging
+from typing import Callable, Optional
 
-from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.runtime.dependencies import get_manifest_context, get_namespace_filter
 from app.core.auth import get_current_user_with_permissions, set_permission_used
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.redis import get_redis
 from app.models.agent import Agent
 from app.models.file import Collection
 from app.models.function import Function
 from app.models.skill import Skill
 from app.models.template import Template
 from app.schemas.agent import AgentResponse
+from app.schemas.discovery import DiscoveryResponse
 from app.schemas.file import CollectionResponse
 from app.schemas.function import FunctionResponse
 from app.schemas.skill import SkillResponse
 from app.schemas.template import TemplateResponse
+from app.services.discovery_cache import discovery_generation
+from app.utils.orm import from_orm_fast
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Serializers for the list responses, built once at import. Endpoints return a
+# pre-encoded Response, so FastAPI skips re-validating against response_model
+# (which is kept for the OpenAPI schema) and the jsonable_encoder pass.
+_agent_list = TypeAdapter(list[AgentResponse])
+_function_list = TypeAdapter(list[FunctionResponse])
+_skill_list = TypeAdapter(list[SkillResponse])
+_collection_list = TypeAdapter(list[CollectionResponse])
+_template_list = TypeAdapter(list[TemplateResponse])
+_discovery = TypeAdapter(DiscoveryResponse)
+
+
+async def _cache_key(
+    request: Request,
+    user_id: str,
+    permissions: dict[str, bool],
+    x_application: Optional[str],
+    app_query: Optional[str],
+) -> Optional[str]:
+    """
+    Per-user response cache key, or None when DISCOVERY_CACHE_TTL is off.
+
+    Keyed on the granted permission set, so role changes miss immediately, and
+    on the discovery generation, which is bumped whenever a listed resource or
+    manifest is written. Callers resolve the app context first, so an invalid
+    ?app= still gets its 400/404.
+    """
+    if settings.discovery_cache_ttl <= 0:
+        return None
+    generation = await discovery_generation()
+    if generation is None:
+        return None
+    granted = sorted(key for key, value in permissions.items() if value)
+    perms_hash = hashlib.sha256(json.dumps(granted).encode()).hexdigest()[:16]
+    app_ref = x_application or app_query or ""
+    return f"sinas:discovery:{generation}:{request.url.path}:{user_id}:{perms_hash}:{app_ref}"
+
+
+async def _cached_response(cache_key: Optional[str]) -> Optional[Response]:
+    if cache_key is None:
+        return None
+    try:
+        redis = await get_redis()
+        cached = await redis.get(cache_key)
+    except Exception as e:
+        logger.warning(f"Discovery cache lookup failed: {e}")
+        return None
+    if cached is None:
+        return None
+    return Response(content=cached, media_type="application/json")
+
+
+async def _json_response(adapter: TypeAdapter, value, cache_key: Optional[str] = None) -> Response:
+    content = adapter.dump_json(value)
+    if cache_key is not None:
+        try:
+            redis = await get_redis()
+            await redis.set(cache_key, content.decode(), ex=settings.discovery_cache_ttl)
+        except Exception as e:
+            logger.warning(f"Discovery cache store failed: {e}")
+    return Response(content=content, media_type="application/json")
+
 
 @router.get("/agents", response_model=list[AgentResponse])
 async def list_agents(
@@ -33,8 +105,21 @@ async def list_agents(
     """List agents visible to the current user, optionally filtered by app context."""
     user_id, permissions = current_user_data
 
+    # Resolved first so an invalid app reference is rejected even without grants
     manifest = await get_manifest_context(db, x_application, app_query)
-    ns_filter = get_namespace_filter(manifest,"agents")
+
+    # No grant that could match any agent: skip cache and DB work
+    if not Agent.can_list(permissions, "read"):
+        set_permission_used(request, "sinas.agents.read")
+        return []
+
+    cache_key = await _cache_key(request, user_id, permissions, x_application, app_query)
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        set_permission_used(request, "sinas.agents.read")
+        return cached
+
+    ns_filter = get_namespace_filter(manifest, "agents")
     if ns_filter is not None and len(ns_filter) == 0:
         set_permission_used(request, "sinas.agents.read")
         return []
@@ -52,7 +137,7 @@ async def list_agents(
     )
 
     set_permission_used(request, "sinas.agents.read")
-    return [AgentResponse.model_validate(agent) for agent in agents]
+    return await _json_response(_agent_list, [AgentResponse.model_validate(agent) for agent in agents], cache_key)
 
 
 @router.get("/functions", response_model=list[FunctionResponse])
@@ -66,8 +151,21 @@ async def list_functions(
     """List functions visible to the current user, optionally filtered by app context."""
     user_id, permissions = current_user_data
 
+    # Resolved first so an invalid app reference is rejected even without grants
     manifest = await get_manifest_context(db, x_application, app_query)
-    ns_filter = get_namespace_filter(manifest,"functions")
+
+    # No grant that could match any function: skip cache and DB work
+    if not Function.can_list(permissions, "read"):
+        set_permission_used(request, "sinas.functions.read")
+        return []
+
+    cache_key = await _cache_key(request, user_id, permissions, x_application, app_query)
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        set_permission_used(request, "sinas.functions.read")
+        return cached
+
+    ns_filter = get_namespace_filter(manifest, "functions")
     if ns_filter is not None and len(ns_filter) == 0:
         set_permission_used(request, "sinas.functions.read")
         return []
@@ -85,7 +183,7 @@ async def list_functions(
     )
 
     set_permission_used(request, "sinas.functions.read")
-    return [FunctionResponse.model_validate(f) for f in functions]
+    return await _json_response(_function_list, [from_orm_fast(FunctionResponse, f) for f in functions], cache_key)
 
 
 @router.get("/skills", response_model=list[SkillResponse])
@@ -99,8 +197,21 @@ async def list_skills(
     """List skills visible to the current user, optionally filtered by app context."""
     user_id, permissions = current_user_data
 
+    # Resolved first so an invalid app reference is rejected even without grants
     manifest = await get_manifest_context(db, x_application, app_query)
-    ns_filter = get_namespace_filter(manifest,"skills")
+
+    # No grant that could match any skill: skip cache and DB work
+    if not Skill.can_list(permissions, "read"):
+        set_permission_used(request, "sinas.skills.read")
+        return []
+
+    cache_key = await _cache_key(request, user_id, permissions, x_application, app_query)
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        set_permission_used(request, "sinas.skills.read")
+        return cached
+
+    ns_filter = get_namespace_filter(manifest, "skills")
     if ns_filter is not None and len(ns_filter) == 0:
         set_permission_used(request, "sinas.skills.read")
         return []
@@ -118,7 +229,7 @@ async def list_skills(
     )
 
     set_permission_used(request, "sinas.skills.read")
-    return [SkillResponse.model_validate(skill) for skill in skills]
+    return await _json_response(_skill_list, [from_orm_fast(SkillResponse, skill) for skill in skills], cache_key)
 
 
 @router.get("/collections", response_model=list[CollectionResponse])
@@ -132,8 +243,21 @@ async def list_collections(
     """List collections visible to the current user, optionally filtered by app context."""
     user_id, permissions = current_user_data
 
+    # Resolved first so an invalid app reference is rejected even without grants
     manifest = await get_manifest_context(db, x_application, app_query)
-    ns_filter = get_namespace_filter(manifest,"collections")
+
+    # No grant that could match any collection: skip cache and DB work
+    if not Collection.can_list(permissions, "read"):
+        set_permission_used(request, "sinas.collections.read")
+        return []
+
+    cache_key = await _cache_key(request, user_id, permissions, x_application, app_query)
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        set_permission_used(request, "sinas.collections.read")
+        return cached
+
+    ns_filter = get_namespace_filter(manifest, "collections")
     if ns_filter is not None and len(ns_filter) == 0:
         set_permission_used(request, "sinas.collections.read")
         return []
@@ -151,7 +275,7 @@ async def list_collections(
     )
 
     set_permission_used(request, "sinas.collections.read")
-    return [CollectionResponse.model_validate(col) for col in collections]
+    return await _json_response(_collection_list, [from_orm_fast(CollectionResponse, c) for c in collections], cache_key)
 
 
 @router.get("/templates", response_model=list[TemplateResponse])
@@ -165,8 +289,21 @@ async def list_templates(
     """List templates visible to the current user, optionally filtered by app context."""
     user_id, permissions = current_user_data
 
+    # Resolved first so an invalid app reference is rejected even without grants
     manifest = await get_manifest_context(db, x_application, app_query)
-    ns_filter = get_namespace_filter(manifest,"templates")
+
+    # No grant that could match any template: skip cache and DB work
+    if not Template.can_list(permissions, "read"):
+        set_permission_used(request, "sinas.templates.read")
+        return []
+
+    cache_key = await _cache_key(request, user_id, permissions, x_application, app_query)
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        set_permission_used(request, "sinas.templates.read")
+        return cached
+
+    ns_filter = get_namespace_filter(manifest, "templates")
     if ns_filter is not None and len(ns_filter) == 0:
         set_permission_used(request, "sinas.templates.read")
         return []
@@ -184,4 +321,96 @@ async def list_templates(
     )
 
     set_permission_used(request, "sinas.templates.read")
-    return [TemplateResponse.model_validate(t) for t in templates]
+    return await _json_response(_template_list, [from_orm_fast(TemplateResponse, t) for t in templates], cache_key)
+
+
+async def _list_visible(
+    db: AsyncSession,
+    model,
+    serialize: Callable,
+    ns_filter: Optional[list[str]],
+    user_id: str,
+    permissions: dict[str, bool],
+) -> list:
+    """List and serialize the resources of one type visible to the user."""
+    if ns_filter is not None and len(ns_filter) == 0:
+        return []
+    if not model.can_list(permissions, "read"):
+        return []
+
+    filters = model.is_active == True if hasattr(model, "is_active") else None  # noqa: E712
+    if ns_filter is not None:
+        ns_clause = model.namespace.in_(ns_filter)
+        filters = ns_clause if filters is None else and_(filters, ns_clause)
+
+    items = await model.list_with_permissions(
+        db=db,
+        user_id=user_id,
+        permissions=permissions,
+        action="read",
+        additional_filters=filters,
+    )
+    return [serialize(item) for item in items]
+
+
+# /discovery/all reads every type, but the request log holds a single key;
+# record the pattern covering each type's sinas.<type>.read
+_DISCOVERY_PERMISSION = "sinas.*.read"
+
+
+@router.get("/discovery/all", response_model=DiscoveryResponse)
+async def list_all(
+    request: Request,
+    x_application: Optional[str] = Header(None),
+    app_query: Optional[str] = Query(None, alias="app"),
+    db: AsyncSession = Depends(get_db),
+    current_user_data=Depends(get_current_user_with_permissions),
+):
+    """
+    List every resource type visible to the current user in one call.
+
+    Resolves the app context once and runs the five listings back to back
+    on the request's session, so one call holds a single pooled connection
+    instead of five HTTP round-trips.
+    """
+    user_id, permissions = current_user_data
+
+    manifest = await get_manifest_context(db, x_application, app_query)
+
+    cache_key = await _cache_key(request, user_id, permissions, x_application, app_query)
+    cached = await _cached_response(cache_key)
+    if cached is not None:
+        set_permission_used(request, _DISCOVERY_PERMISSION)
+        return cached
+
+    def ns(resource_type: str) -> Optional[list[str]]:
+        return get_namespace_filter(manifest, resource_type)
+
+    # An AsyncSession can't run statements concurrently, and a session per
+    # listing would hold several pool connections for one request
+    agents = await _list_visible(
+        db, Agent, AgentResponse.model_validate, ns("agents"), user_id, permissions
+    )
+    functions = await _list_visible(
+        db, Function, lambda f: from_orm_fast(FunctionResponse, f), ns("functions"), user_id, permissions
+    )
+    skills = await _list_visible(
+        db, Skill, lambda s: from_orm_fast(SkillResponse, s), ns("skills"), user_id, permissions
+    )
+    collections = await _list_visible(
+        db, Collection, lambda c: from_orm_fast(CollectionResponse, c), ns("collections"), user_id, permissions
+    )
+    templates = await _list_visible(
+        db, Template, lambda t: from_orm_fast(TemplateResponse, t), ns("templates"), user_id, permissions
+    )
+
+    set_permission_used(request, _DISCOVERY_PERMISSION)
+
+    payload = DiscoveryResponse.model_construct(
+        agents=agents,
+        functions=functions,
+        skills=skills,
+        collections=collections,
+        templates=templates,
+    )
+    return await _json_response(_discovery, payload, cache_key)
@@ -1,25 +1,31 @@
 """File runtime endpoints - upload, download, list, delete, search."""
 
+import asyncio
 import base64
+import hashlib
+import json
 import logging
 import re
 import uuid as uuid_lib
 from datetime import timezone
 from email.utils import format_datetime, parsedate_to_datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import jsonschema
 from jose import JWTError, jwt
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, UploadFile, status
 from fastapi.responses import Response
-from sqlalchemy import and_, func, or_, select
+from pydantic import TypeAdapter
+from sqlalchemy import and_, delete, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.auth import get_current_user_with_permissions, set_permission_used
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.permissions import check_permission
+from app.core.redis import get_redis
 from app.models.execution import TriggerType
 from app.models.file import Collection, ContentFilterEvaluation, File, FileVersion
 from app.models.function import Function
@@ -39,12 +45,94 @@ from app.schemas.file import (
 
 from app.services.file_storage import FileStorage, get_storage, generate_file_url
 from app.services.queue_service import queue_service
+from app.utils.orm import from_orm_fast
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Pre-encodes list_files output so FastAPI doesn't re-validate every file and
+# version against response_model (kept for the OpenAPI schema).
+_file_list = TypeAdapter(list[FileWithVersions])
+
+# Multipart uploads are copied from Starlette's spooled temp file to storage
+# in chunks of this size.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Payloads above this are base64-transcoded and hashed in a worker thread so
+# large uploads/downloads don't stall the event loop.
+BASE64_OFFLOAD_THRESHOLD = 256 * 1024
+
+
+async def _b64decode(data: str) -> bytes:
+    if len(data) > BASE64_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(base64.b64decode, data)
+    return base64.b64decode(data)
+
+
+async def _b64encode(data: bytes) -> str:
+    if len(data) > BASE64_OFFLOAD_THRESHOLD:
+        encoded = await asyncio.to_thread(base64.b64encode, data)
+    else:
+        encoded = base64.b64encode(data)
+    return encoded.decode("ascii")
+
+
+async def _sha256(data: bytes) -> str:
+    # hashlib's OpenSSL SHA-256 releases the GIL on large buffers
+    if len(data) > BASE64_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(FileStorage.calculate_hash, data)
+    return FileStorage.calculate_hash(data)
+
+
+def _content_filter_cache_key(func_record: Function, file_hash: str, filter_input: dict) -> str:
+    """Key a filter result on the function revision, the content and every other input."""
+    params = {k: v for k, v in filter_input.items() if k != "content_base64"}
+    params_hash = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    revision = func_record.updated_at.isoformat() if func_record.updated_at else ""
+    return f"sinas:content_filter:{func_record.id}:{revision}:{file_hash}:{params_hash}"
+
+
+async def _get_cached_filter_result(key: str) -> Optional[dict]:
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Content filter cache lookup failed: {e}")
+        return None
+    return json.loads(cached) if cached else None
+
+
+async def _cache_filter_result(key: str, result: dict) -> None:
+    try:
+        redis = await get_redis()
+        await redis.set(key, json.dumps(result, default=str), ex=settings.content_filter_cache_ttl)
+    except Exception as e:
+        logger.warning(f"Content filter cache store failed: {e}")
+
+
+async def _iter_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    await upload.seek(0)
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+def _collection_perm(namespace: str, collection: str, action: str, scope: str) -> str:
+    """Build a sinas.collections/{namespace}/{collection}.{action}:{scope} permission key."""
+    return f"sinas.collections/{namespace}/{collection}.{action}:{scope}"
+
+
+def _with_version(file_query, version: Optional[int]):
+    """Outer-join the requested (default: current) FileVersion onto a File query."""
+    return file_query.add_columns(FileVersion).outerjoin(
+        FileVersion,
+        and_(
+            FileVersion.file_id == File.id,
+            FileVersion.version_number == func.coalesce(version or None, File.current_version),
+        ),
+    )
+
 
 def _unique_filename(name: str) -> str:
     """Append a compact unique suffix before the file extension."""
@@ -236,11 +324,70 @@ async def upload_file(
     If the collection doesn't exist, it will be auto-created with defaults.
     If a file with the same name exists, a new version is created.
     """
+    return await _store_upload(namespace, collection, file_data, http_request, db, current_user_data)
+
+
+@router.post("/{namespace}/{collection}/stream", response_model=FileResponse, status_code=status.HTTP_201_CREATED)
+async def upload_file_stream(
+    namespace: str,
+    collection: str,
+    http_request: Request,
+    file: UploadFile,
+    name: Optional[str] = Form(None, min_length=1, max_length=255, pattern=r"^[^/]+$"),
+    content_type: Optional[str] = Form(None, min_length=1, max_length=255),
+    visibility: str = Form("private", pattern=r"^(private|shared)$"),
+    file_metadata: str = Form("{}", description="JSON object of file metadata"),
+    update_existing: bool = Form(False),
+    db: AsyncSession = Depends(get_db),
+    current_user_data: tuple = Depends(get_current_user_with_permissions),
+):
+    """
+    Upload a file to a collection as multipart/form-data.
+
+    Same semantics as the JSON upload, but the content is copied to storage in
+    chunks from the spooled request body instead of being held in memory as
+    base64 and bytes. Collections with a content filter still buffer the file,
+    since the filter receives it base64-encoded.
+    """
+    try:
+        metadata = json.loads(file_metadata)
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid file_metadata JSON: {e.msg}") from e
+    if not isinstance(metadata, dict):
+        raise HTTPException(status_code=400, detail="file_metadata must be a JSON object")
+
+    file_name = name or file.filename
+    if not file_name or "/" in file_name or len(file_name) > 255:
+        raise HTTPException(status_code=400, detail="A valid file name is required")
+
+    file_data = FileUpload(
+        name=file_name,
+        content_base64="",
+        content_type=content_type or file.content_type or "application/octet-stream",
+        visibility=visibility,
+        file_metadata=metadata,
+        update_existing=update_existing,
+    )
+    return await _store_upload(
+        namespace, collection, file_data, http_request, db, current_user_data, stream=file
+    )
+
+
+async def _store_upload(
+    namespace: str,
+    collection: str,
+    file_data: FileUpload,
+    http_request: Request,
+    db: AsyncSession,
+    current_user_data: tuple,
+    stream: Optional[UploadFile] = None,
+):
+    """Validate, filter and persist an upload from base64 content or a multipart stream."""
     user_id, permissions = current_user_data
     storage: FileStorage = get_storage()
 
     # Check upload permission
-    perm = f"sinas.collections/{namespace}/{collection}.upload:own"
+    perm = _collection_perm(namespace, collection, "upload", "own")
     if not check_permission(permissions, perm):
         set_permission_used(http_request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to upload files to this collection")
@@ -275,14 +422,28 @@ async def upload_file(
                 detail=f"File metadata validation failed: {e.message}"
             )
 
-    # Decode file content
-    try:
-        file_content = base64.b64decode(file_data.content_base64)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid base64 content: {str(e)}")
+    if stream is None:
+        # Decode file content
+        try:
+            file_content = await _b64decode(file_data.content_base64)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid base64 content: {str(e)}")
+        file_size_bytes = len(file_content)
+    elif coll.content_filter_function:
+        # The content filter takes base64 input, so filtered collections
+        # buffer streamed uploads like JSON ones
+        await stream.seek(0)
+        file_content = await stream.read()
+        file_data.content_base64 = await _b64encode(file_content)
+        file_size_bytes = len(file_content)
+        stream = None
+    else:
+        file_content = None
+        file_size_bytes = stream.size
+        if file_size_bytes is None:
+            file_size_bytes = await asyncio.to_thread(stream.file.seek, 0, 2)
 
     # Check file size
-    file_size_bytes = len(file_content)
     file_size_mb = file_size_bytes / (1024 * 1024)
     if file_size_mb > coll.max_file_size_mb:
         raise HTTPException(
@@ -305,8 +466,8 @@ async def upload_file(
             detail=f"Collection storage quota exceeded ({current_gb:.2f}GB / {coll.max_total_size_gb}GB)"
         )
 
-    # Calculate hash
-    file_hash = storage.calculate_hash(file_content)
+    # Calculate hash (streamed uploads are hashed while being written)
+    file_hash = await _sha256(file_content) if file_content is not None else None
 
     # Run content filter if configured
     approved_content = file_content
@@ -314,10 +475,13 @@ async def upload_file(
     filter_result = None
 
     if coll.content_filter_function:
-        filter_namespace, filter_name = coll.content_filter_function.split("/")
-
-        # Get function
-        func_record = await Function.get_by_name(db, filter_namespace, filter_name)
+        filter_ref = coll.content_filter_ref
+        if filter_ref:
+            filter_namespace, filter_name = filter_ref
+            # Get function
+            func_record = await Function.get_by_name(db, filter_namespace, filter_name)
+        else:
+            func_record = None
         if not func_record:
             raise HTTPException(
                 status_code=500,
@@ -340,19 +504,29 @@ async def upload_file(
         filter_execution_id = str(uuid_lib.uuid4())
 
         try:
-            # Release DB connection before blocking wait — prevents connection
-            # starvation when the filter function calls back into the API
-            await db.commit()
-
-            filter_result = await queue_service.enqueue_and_wait(
-                function_namespace=filter_namespace,
-                function_name=filter_name,
-                input_data=filter_input,
-                execution_id=filter_execution_id,
-                trigger_type=TriggerType.MANUAL.value,
-                trigger_id=f"content_filter:{namespace}/{collection}",
-                user_id=user_id,
-            )
+            # Identical uploads (same filter revision, content and inputs) reuse
+            # the previous verdict when CONTENT_FILTER_CACHE_TTL is set
+            cache_key = None
+            if settings.content_filter_cache_ttl > 0:
+                cache_key = _content_filter_cache_key(func_record, file_hash, filter_input)
+                filter_result = await _get_cached_filter_result(cache_key)
+
+            if filter_result is None:
+                # Release DB connection before blocking wait — prevents connection
+                # starvation when the filter function calls back into the API
+                await db.commit()
+
+                filter_result = await queue_service.enqueue_and_wait(
+                    function_namespace=filter_namespace,
+                    function_name=filter_name,
+                    input_data=filter_input,
+                    execution_id=filter_execution_id,
+                    trigger_type=TriggerType.MANUAL.value,
+                    trigger_id=f"content_filter:{namespace}/{collection}",
+                    user_id=user_id,
+                )
+                if cache_key and isinstance(filter_result, dict):
+                    await _cache_filter_result(cache_key, filter_result)
 
             # Validate result structure
             if not isinstance(filter_result, dict):
@@ -368,11 +542,13 @@ async def upload_file(
                     detail=filter_result.get('reason', 'No reason provided')
                 )
 
-            # Apply modifications if provided
-            if filter_result.get("modified_content"):
+            # Apply modifications if provided; filters that echo the original
+            # content back don't cost a second decode and hash
+            modified_content = filter_result.get("modified_content")
+            if modified_content and modified_content != file_data.content_base64:
                 try:
-                    approved_content = base64.b64decode(filter_result["modified_content"])
-                    file_hash = storage.calculate_hash(approved_content)
+                    approved_content = await _b64decode(modified_content)
+                    file_hash = await _sha256(approved_content)
                 except Exception as e:
                     raise HTTPException(
                         status_code=500,
@@ -462,7 +638,12 @@ async def upload_file(
 
     # Save to storage FIRST, then commit DB (prevents orphan DB records)
     try:
-        await storage.save(storage_path, approved_content)
+        if stream is not None:
+            file_hash = await storage.save_stream(storage_path, _iter_upload(stream))
+            stored_size = file_size_bytes
+        else:
+            await storage.save(storage_path, approved_content)
+            stored_size = len(approved_content)
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -475,7 +656,7 @@ async def upload_file(
         file_id=file_record.id,
         version_number=file_record.current_version,
         storage_path=storage_path,
-        size_bytes=len(approved_content),
+        size_bytes=stored_size,
         hash_sha256=file_hash,
         uploaded_by=user_id,
     )
@@ -507,8 +688,8 @@ async def upload_file(
         )
 
     # Trigger post-upload function if configured (async, don't block)
-    if coll.post_upload_function:
-        post_namespace, post_name = coll.post_upload_function.split("/")
+    if coll.post_upload_ref:
+        post_namespace, post_name = coll.post_upload_ref
 
         # Get post-upload function
         post_func = await Function.get_by_name(db, post_namespace, post_name)
@@ -528,7 +709,6 @@ async def upload_file(
             post_execution_id = str(uuid_lib.uuid4())
 
             try:
-
                 await queue_service.enqueue_function(
                     function_namespace=post_namespace,
                     function_name=post_name,
@@ -539,24 +719,16 @@ async def upload_file(
                     user_id=user_id,
                 )
             except Exception:
-                # Don't fail upload if post-upload trigger fails
-                pass
+                # Don't fail upload if post-upload trigger fails, but don't
+                # lose the trigger silently either
+                logger.exception(
+                    f"Failed to enqueue post-upload function {coll.post_upload_function} "
+                    f"for file {file_record.id} (execution {post_execution_id})"
+                )
 
     url = generate_file_url(str(file_record.id), file_record.current_version)
 
-    return FileResponse(
-        id=file_record.id,
-        namespace=namespace,
-        name=file_record.name,
-        user_id=file_record.user_id,
-        content_type=file_record.content_type,
-        current_version=file_record.current_version,
-        file_metadata=file_record.file_metadata,
-        visibility=file_record.visibility,
-        url=url,
-        created_at=file_record.created_at,
-        updated_at=file_record.updated_at,
-    )
+    return from_orm_fast(FileResponse, file_record, namespace=namespace, url=url)
 
 
 @router.get("/{namespace}/{collection}/{filename}", response_model=FileDownloadResponse)
@@ -574,7 +746,7 @@ async def download_file(
     storage: FileStorage = get_storage()
 
     # Check download permission
-    perm = f"sinas.collections/{namespace}/{collection}.download:own"
+    perm = _collection_perm(namespace, collection, "download", "own")
     if not check_permission(permissions, perm):
         set_permission_used(http_request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to download files from this collection")
@@ -586,7 +758,7 @@ async def download_file(
         raise HTTPException(status_code=404, detail="Collection not found")
 
     # Get file — prefer user's own, then shared
-    has_all_perm = check_permission(permissions, f"sinas.collections/{namespace}/{collection}.download:all")
+    has_all_perm = check_permission(permissions, _collection_perm(namespace, collection, "download", "all"))
     file_query = select(File).where(
         and_(
             File.collection_id == coll.id,
@@ -601,27 +773,18 @@ async def download_file(
         (File.user_id == user_id).desc()
     ).limit(1)
 
-    result = await db.execute(file_query)
-    file_record = result.scalar_one_or_none()
+    # File and requested version in one round-trip
+    result = await db.execute(_with_version(file_query, version))
+    row = result.first()
 
-    if not file_record:
+    if not row:
         raise HTTPException(status_code=404, detail="File not found")
+    file_record, file_version = row
 
     if file_record.visibility == "private" and str(file_record.user_id) != user_id and not has_all_perm:
         raise HTTPException(status_code=403, detail="Not authorized to access this private file")
 
-    # Get version
     version_number = version or file_record.current_version
-    result = await db.execute(
-        select(FileVersion).where(
-            and_(
-                FileVersion.file_id == file_record.id,
-                FileVersion.version_number == version_number
-            )
-        ).limit(1)
-    )
-    file_version = result.scalar_one_or_none()
-
     if not file_version:
         raise HTTPException(status_code=404, detail=f"Version {version_number} not found")
 
@@ -632,7 +795,7 @@ async def download_file(
         raise HTTPException(status_code=404, detail="File content not found in storage")
 
     return FileDownloadResponse(
-        content_base64=base64.b64encode(file_content).decode("utf-8"),
+        content_base64=await _b64encode(file_content),
         content_type=file_record.content_type,
         file_metadata=file_record.file_metadata,
         version=version_number,
@@ -659,7 +822,7 @@ async def generate_temp_url(
     user_id, permissions = current_user_data
 
     # Reuse download permission
-    perm = f"sinas.collections/{namespace}/{collection}.download:own"
+    perm = _collection_perm(namespace, collection, "download", "own")
     if not check_permission(permissions, perm):
         set_permission_used(http_request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to access files in this collection")
@@ -674,7 +837,7 @@ async def generate_temp_url(
         raise HTTPException(status_code=404, detail="Collection not found")
 
     # Get file — prefer user's own, then shared
-    has_all_perm = check_permission(permissions, f"sinas.collections/{namespace}/{collection}.download:all")
+    has_all_perm = check_permission(permissions, _collection_perm(namespace, collection, "download", "all"))
     file_query = select(File).where(
         and_(
             File.collection_id == coll.id,
@@ -689,27 +852,18 @@ async def generate_temp_url(
         (File.user_id == user_id).desc()
     ).limit(1)
 
-    result = await db.execute(file_query)
-    file_record = result.scalar_one_or_none()
-    if not file_record:
+    # File and requested version in one round-trip
+    result = await db.execute(_with_version(file_query, version))
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=404, detail="File not found")
+    file_record, file_version = row
 
     if file_record.visibility == "private" and str(file_record.user_id) != user_id and not has_all_perm:
         raise HTTPException(status_code=403, detail="Not authorized to access this private file")
 
-    # Determine version
-    version_number = version or file_record.current_version
-
     # Verify version exists
-    ver_result = await db.execute(
-        select(FileVersion).where(
-            and_(
-                FileVersion.file_id == file_record.id,
-                FileVersion.version_number == version_number,
-            )
-        ).limit(1)
-    )
-    file_version = ver_result.scalar_one_or_none()
+    version_number = version or file_record.current_version
     if not file_version:
         raise HTTPException(status_code=404, detail=f"Version {version_number} not found")
 
@@ -736,7 +890,7 @@ async def list_files(
     user_id, permissions = current_user_data
 
     # Check list permission
-    perm = f"sinas.collections/{namespace}/{collection}.list:own"
+    perm = _collection_perm(namespace, collection, "list", "own")
     if not check_permission(permissions, perm):
         set_permission_used(http_request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to list files in this collection")
@@ -748,9 +902,15 @@ async def list_files(
         raise HTTPException(status_code=404, detail="Collection not found")
 
     # Get files
-    has_all_perm = check_permission(permissions, f"sinas.collections/{namespace}/{collection}.list:all")
+    has_all_perm = check_permission(permissions, _collection_perm(namespace, collection, "list", "all"))
 
-    query = select(File).where(File.collection_id == coll.id)
+    # Versions are batch-loaded in one extra SELECT ... WHERE file_id IN (...)
+    # (ordered newest first by the File.versions relationship)
+    query = (
+        select(File)
+        .where(File.collection_id == coll.id)
+        .options(selectinload(File.versions))
+    )
 
     if not has_all_perm:
         # Own files (any visibility) + non-private files from others
@@ -766,31 +926,17 @@ async def list_files(
     result = await db.execute(query)
     files = result.scalars().all()
 
-    # Load versions for each file
-    responses = []
-    for file_record in files:
-        result = await db.execute(
-            select(FileVersion)
-            .where(FileVersion.file_id == file_record.id)
-            .order_by(FileVersion.version_number.desc())
-        )
-        versions = result.scalars().all()
-
-        responses.append(FileWithVersions(
-            id=file_record.id,
+    responses = [
+        from_orm_fast(
+            FileWithVersions,
+            file_record,
             namespace=namespace,
-            name=file_record.name,
-            user_id=file_record.user_id,
-            content_type=file_record.content_type,
-            current_version=file_record.current_version,
-            file_metadata=file_record.file_metadata,
-            visibility=file_record.visibility,
-            created_at=file_record.created_at,
-            updated_at=file_record.updated_at,
-            versions=[FileVersionResponse.model_validate(v) for v in versions]
-        ))
+            versions=[from_orm_fast(FileVersionResponse, v) for v in file_record.versions],
+        )
+        for file_record in files
+    ]
 
-    return responses
+    return Response(content=_file_list.dump_json(responses), media_type="application/json")
 
 
 @router.post("/{namespace}/{collection}/search", response_model=list[FileSearchResult])
@@ -807,7 +953,7 @@ async def search_files(
     storage: FileStorage = get_storage()
 
     # Reuse list permission for search
-    perm = f"sinas.collections/{namespace}/{collection}.list:own"
+    perm = _collection_perm(namespace, collection, "list", "own")
     if not check_permission(permissions, perm):
         set_permission_used(http_request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to search files in this collection")
@@ -819,7 +965,7 @@ async def search_files(
         raise HTTPException(status_code=404, detail="Collection not found")
 
     # Build base query with visibility rules
-    has_all_perm = check_permission(permissions, f"sinas.collections/{namespace}/{collection}.list:all")
+    has_all_perm = check_permission(permissions, _collection_perm(namespace, collection, "list", "all"))
     query = select(File).where(File.collection_id == coll.id)
 
     if not has_all_perm:
@@ -936,7 +1082,7 @@ async def update_file_metadata(
     user_id, permissions = current_user_data
 
     # Reuse upload permission for metadata edits
-    perm = f"sinas.collections/{namespace}/{collection}.upload:own"
+    perm = _collection_perm(namespace, collection, "upload", "own")
     if not check_permission(permissions, perm):
         set_permission_used(http_request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to update files in this collection")
@@ -948,7 +1094,7 @@ async def update_file_metadata(
         raise HTTPException(status_code=404, detail="Collection not found")
 
     # Get file — prefer user's own, then shared
-    has_all_perm = check_permission(permissions, f"sinas.collections/{namespace}/{collection}.upload:all")
+    has_all_perm = check_permission(permissions, _collection_perm(namespace, collection, "upload", "all"))
     file_query = select(File).where(
         and_(
             File.collection_id == coll.id,
@@ -988,19 +1134,7 @@ async def update_file_metadata(
 
     url = generate_file_url(str(file_record.id), file_record.current_version)
 
-    return FileResponse(
-        id=file_record.id,
-        namespace=namespace,
-        name=file_record.name,
-        user_id=file_record.user_id,
-        content_type=file_record.content_type,
-        current_version=file_record.current_version,
-        file_metadata=file_record.file_metadata,
-        visibility=file_record.visibility,
-        url=url,
-        created_at=file_record.created_at,
-        updated_at=file_record.updated_at,
-    )
+    return from_orm_fast(FileResponse, file_record, namespace=namespace, url=url)
 
 
 @router.delete("/{namespace}/{collection}/{filename}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1017,7 +1151,7 @@ async def delete_file(
     storage: FileStorage = get_storage()
 
     # Check delete permission
-    perm = f"sinas.collections/{namespace}/{collection}.delete_files:own"
+    perm = _collection_perm(namespace, collection, "delete_files", "own")
     if not check_permission(permissions, perm):
         set_permission_used(http_request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to delete files from this collection")
@@ -1029,7 +1163,7 @@ async def delete_file(
         raise HTTPException(status_code=404, detail="Collection not found")
 
     # Get file — prefer user's own, then shared
-    has_all_perm = check_permission(permissions, f"sinas.collections/{namespace}/{collection}.delete_files:all")
+    has_all_perm = check_permission(permissions, _collection_perm(namespace, collection, "delete_files", "all"))
     file_query = select(File).where(
         and_(
             File.collection_id == coll.id,
@@ -1040,9 +1174,10 @@ async def delete_file(
         file_query = file_query.where(
             or_(File.user_id == user_id, File.visibility == "shared")
         )
+    # Eager-load versions for their storage paths
     file_query = file_query.order_by(
         (File.user_id == user_id).desc()
-    ).limit(1)
+    ).limit(1).options(selectinload(File.versions))
 
     result = await db.execute(file_query)
     file_record = result.scalar_one_or_none()
@@ -1053,22 +1188,12 @@ async def delete_file(
     if file_record.visibility == "private" and str(file_record.user_id) != user_id and not has_all_perm:
         raise HTTPException(status_code=403, detail="Not authorized to delete this private file")
 
-    # Get all versions of this file
-    result = await db.execute(
-        select(FileVersion).where(FileVersion.file_id == file_record.id)
-    )
-    versions = result.scalars().all()
-
-    # Delete physical files
-    for version in versions:
-        try:
-            await storage.delete(version.storage_path)
-        except Exception:
-            # Continue even if storage deletion fails
-            pass
+    # Delete physical files (failures are logged; the DB delete still proceeds)
+    await storage.delete_many([version.storage_path for version in file_record.versions])
 
-    # Delete database record (cascade will delete versions and evaluations)
-    await db.delete(file_record)
+    # Delete database record in one statement; the ON DELETE CASCADE foreign
+    # keys remove versions and evaluations server-side
+    await db.execute(delete(File).where(File.id == file_record.id))
     await db.flush()
 
     return None
@@ -1,12 +1,12 @@
 """Runtime state access within stores."""
 import json
 import uuid
-from datetime import datetime
 from typing import Optional
 
 import jsonschema
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import and_, or_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import and_, delete, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user_with_permissions, set_permission_used
@@ -16,6 +16,7 @@ from app.core.permissions import check_permission
 from app.models.state import State
 from app.models.store import Store
 from app.schemas.state import StateCreate, StateResponse, StateUpdate
+from app.utils.cursor import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/stores", tags=["runtime-stores"])
 
@@ -109,22 +110,6 @@ async def create_state(
     # Schema validation
     _validate_against_schema(store, state_data.key, state_data.value)
 
-    # Uniqueness check
-    result = await db.execute(
-        select(State).where(
-            and_(
-                State.user_id == user_uuid,
-                State.store_id == store.id,
-                State.key == state_data.key,
-            )
-        )
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=400,
-            detail=f"State with key '{state_data.key}' already exists in store '{namespace}/{name}'",
-        )
-
     # Determine encryption
     should_encrypt = state_data.encrypted or store.encrypted
     encrypted_value = None
@@ -151,8 +136,19 @@ async def create_state(
     )
 
     db.add(state)
-    await db.flush()
-    await db.refresh(state)
+    # Uniqueness is enforced by uq_state_user_store_key — no pre-check SELECT
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # Only the duplicate-key violation means "already exists"; anything
+        # else (FK, NOT NULL) is a real error
+        if "uq_state_user_store_key" not in str(e.orig):
+            raise
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"State with key '{state_data.key}' already exists in store '{namespace}/{name}'",
+        ) from e
 
     return _state_to_response(state, store)
 
@@ -162,15 +158,24 @@ async def list_states(
     namespace: str,
     name: str,
     request: Request,
+    response: Response,
     search: Optional[str] = Query(None),
     tags: Optional[str] = Query(None),
     owner: Optional[str] = Query(None, description="Filter by owner: 'me' (default), 'all', or a user ID"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous page's X-Next-Cursor header (replaces skip)"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user_data=Depends(get_current_user_with_permissions),
 ):
-    """List states in a store."""
+    """
+    List states in a store, newest first.
+
+    Full pages set an X-Next-Cursor header; pass it back as ?cursor= to fetch
+    the next page without the cost of a deep OFFSET.
+    """
     user_id, permissions = current_user_data
     user_uuid = uuid.UUID(user_id)
 
@@ -185,7 +190,7 @@ async def list_states(
     query = select(State).where(
         and_(
             State.store_id == store.id,
-            or_(State.expires_at == None, State.expires_at > datetime.utcnow()),
+            State.not_expired(),
         )
     )
 
@@ -222,9 +227,19 @@ async def list_states(
         else:
             query = query.where(State.user_id == user_uuid)
 
-    result = await db.execute(query.offset(skip).limit(limit))
+    query = query.order_by(State.created_at.desc(), State.id.desc())
+    if cursor:
+        query = query.where(tuple_(State.created_at, State.id) < decode_cursor(cursor))
+    else:
+        query = query.offset(skip)
+
+    result = await db.execute(query.limit(limit))
     all_states = result.scalars().all()
 
+    if len(all_states) == limit:
+        last = all_states[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
     return [_state_to_response(s, store) for s in all_states]
 
 
@@ -366,7 +381,6 @@ async def update_state(
         state.visibility = state_data.visibility
 
     await db.flush()
-    await db.refresh(state)
 
     return _state_to_response(state, store)
 
@@ -384,29 +398,36 @@ async def delete_state(
     user_id, permissions = current_user_data
     user_uuid = uuid.UUID(user_id)
 
-    store = await _get_store(db, namespace, name)
-
+    # The permission only depends on the store reference, so check it before
+    # touching the DB
     perm = f"sinas.stores/{namespace}/{name}.write_state:own"
     if not check_permission(permissions, perm):
         set_permission_used(request, perm, has_perm=False)
         raise HTTPException(status_code=403, detail="Not authorized to write to this store")
     set_permission_used(request, perm)
 
+    # Single DELETE ... RETURNING with the store resolved in a subquery,
+    # instead of loading the store and then deleting
+    store_id = (
+        select(Store.id)
+        .where(Store.namespace == namespace, Store.name == name)
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(State).where(
+        delete(State)
+        .where(
             and_(
-                State.store_id == store.id,
+                State.store_id == store_id,
                 State.key == key,
                 State.user_id == user_uuid,
             )
         )
+        .returning(State.id)
     )
-    state = result.scalar_one_or_none()
 
-    if not state:
+    if result.scalar_one_or_none() is None:
+        # Nothing deleted: report a missing store before a missing key
+        await _get_store(db, namespace, name)
         raise HTTPException(status_code=404, detail=f"State '{key}' not found")
 
-    await db.delete(state)
-    await db.flush()
-
     return {"message": f"State '{key}' deleted from store '{namespace}/{name}'"}
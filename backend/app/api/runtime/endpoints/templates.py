@@ -20,6 +20,7 @@ from app.schemas.template import (
     TemplateRenderResponse,
 )
 from app.services.template_renderer import render_template
+from app.utils.schema import validate_cached
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +100,7 @@ async def render_template_endpoint(
         try:
             import jsonschema
 
-            jsonschema.validate(render_request.variables, template.variable_schema)
+            validate_cached(render_request.variables, template.variable_schema)
         except jsonschema.ValidationError as e:
             raise HTTPException(status_code=400, detail=f"Variable validation failed: {e.message}")
 
@@ -166,7 +167,7 @@ async def send_email_with_template(
         try:
             import jsonschema
 
-            jsonschema.validate(email_request.variables, template.variable_schema)
+            validate_cached(email_request.variables, template.variable_schema)
         except jsonschema.ValidationError as e:
             raise HTTPException(status_code=400, detail=f"Variable validation failed: {e.message}")
 
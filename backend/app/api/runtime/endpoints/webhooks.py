@@ -1,24 +1,33 @@
 """Runtime webhook endpoints - execute functions via HTTP."""
+import asyncio
 import json
 import uuid
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import set_permission_used, verify_jwt_or_api_key
 from app.core.database import get_db
 from app.core.permissions import check_permission
 from app.models.execution import TriggerType
-from app.models.webhook import Webhook
 from app.services.dedup_service import check_and_mark, store_result
 from app.services.queue_service import queue_service
-
+from app.services.webhook_cache import get_active_webhook
 
 router = APIRouter()
 
+# JSON bodies above this size are parsed in a worker thread so a large payload
+# doesn't stall the event loop for other in-flight requests
+JSON_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+async def _parse_json_body(request: Request):
+    raw_body = await request.body()
+    if len(raw_body) > JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(json.loads, raw_body)
+    return json.loads(raw_body)
 
 
 @router.api_route(
@@ -32,16 +41,7 @@ async def execute_webhook(
 ):
     """Execute webhook by triggering associated function."""
     # Look up webhook configuration
-    result = await db.execute(
-        select(Webhook).where(
-            and_(
-                Webhook.path == path,
-                Webhook.http_method == request.method,
-                Webhook.is_active == True,
-            )
-        )
-    )
-    webhook = result.scalar_one_or_none()
+    webhook = await get_active_webhook(db, path, request.method)
 
     if not webhook:
         raise HTTPException(
@@ -49,6 +49,10 @@ async def execute_webhook(
             detail=f"No active webhook found for path '{path}' and method '{request.method}'",
         )
 
+    # Stringified once; both are reused for auth, dedup keys and the job payload
+    webhook_id = str(webhook.id)
+    owner_id = str(webhook.user_id)
+
     # Authenticate if required
     user_id: Optional[str] = None
     if webhook.requires_auth:
@@ -69,6 +73,7 @@ async def execute_webhook(
                 )
 
             user_id, email, permissions = await verify_jwt_or_api_key(
+                request=request,
                 credentials=credentials,
                 x_api_key=api_key_header,
                 db=db,
@@ -78,25 +83,23 @@ async def execute_webhook(
             function_perm = f"sinas.functions/{webhook.function_namespace}/{webhook.function_name}.execute:own"
             function_perm_all = f"sinas.functions/{webhook.function_namespace}/{webhook.function_name}.execute:all"
 
-            has_permission = check_permission(permissions, function_perm_all) or (
-                check_permission(permissions, function_perm) and str(webhook.user_id) == user_id
+            has_all = check_permission(permissions, function_perm_all)
+            has_permission = has_all or (
+                owner_id == user_id and check_permission(permissions, function_perm)
             )
 
             if not has_permission:
                 set_permission_used(request, function_perm, has_perm=False)
                 raise HTTPException(status_code=403, detail=f"Not authorized to execute webhook '{path}'")
 
-            set_permission_used(
-                request,
-                function_perm_all if check_permission(permissions, function_perm_all) else function_perm,
-            )
+            set_permission_used(request, function_perm_all if has_all else function_perm)
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
     else:
         # Use webhook owner's user_id for unauthenticated webhooks
-        user_id = str(webhook.user_id)
+        user_id = owner_id
         set_permission_used(request, f"webhook.public:{webhook.path}")
 
     try:
@@ -104,7 +107,7 @@ async def execute_webhook(
         content_type = request.headers.get("content-type", "")
         if "application/json" in content_type:
             try:
-                input_data = await request.json()
+                input_data = await _parse_json_body(request)
             except Exception:
                 input_data = {}
         elif request.method == "GET":
@@ -120,9 +123,10 @@ async def execute_webhook(
 
         # Deduplication check
         if webhook.dedup:
+            # Built once and reused when storing the sync result below
             req_headers = dict(request.headers)
             is_dup, cached = await check_and_mark(
-                webhook_id=str(webhook.id),
+                webhook_id=webhook_id,
                 body=final_input if isinstance(final_input, dict) else {},
                 headers=req_headers,
                 dedup_config=webhook.dedup,
@@ -143,7 +147,7 @@ async def execute_webhook(
                 input_data=final_input,
                 execution_id=execution_id,
                 trigger_type=TriggerType.WEBHOOK.value,
-                trigger_id=str(webhook.id),
+                trigger_id=webhook_id,
                 user_id=user_id,
                 chat_id=chat_id,
             )
@@ -156,7 +160,7 @@ async def execute_webhook(
             input_data=final_input,
             execution_id=execution_id,
             trigger_type=TriggerType.WEBHOOK.value,
-            trigger_id=str(webhook.id),
+            trigger_id=webhook_id,
             user_id=user_id,
             chat_id=chat_id,
         )
@@ -166,9 +170,8 @@ async def execute_webhook(
         # Cache result for dedup
         if webhook.dedup:
             try:
-                req_headers = dict(request.headers)
                 await store_result(
-                    webhook_id=str(webhook.id),
+                    webhook_id=webhook_id,
                     body=final_input if isinstance(final_input, dict) else {},
                     headers=req_headers,
                     dedup_config=webhook.dedup,
@@ -2,14 +2,15 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.auth import generate_api_key, get_current_user_with_permissions, set_permission_used
 from app.core.database import get_db
 from app.core.permissions import check_permission
 from app.models import APIKey
 from app.schemas.api_key import APIKeyCreate, APIKeyCreated, APIKeyResponse
+from app.utils.orm import from_orm_fast
 
 router = APIRouter()
 
@@ -78,9 +79,7 @@ async def list_api_keys(
     """
     user_id, permissions = current_user_data
 
-    # Use PermissionMixin for permission-aware filtering
-    from sqlalchemy.orm import selectinload
-
+    # Permission-aware filtering, with users eager-loaded and newest first
     api_keys = await APIKey.list_with_permissions(
         db=db,
         user_id=user_id,
@@ -89,33 +88,17 @@ async def list_api_keys(
         additional_filters=None,
         skip=0,
         limit=1000,
+        options=[selectinload(APIKey.user)],
+        order_by=APIKey.created_at.desc(),
     )
 
-    # Eagerly load user relationship for all keys
-    key_ids = [key.id for key in api_keys]
-    if key_ids:
-        result = await db.execute(
-            select(APIKey).where(APIKey.id.in_(key_ids)).options(selectinload(APIKey.user))
-        )
-        loaded_keys = {str(k.id): k for k in result.scalars().all()}
-        # Replace keys with loaded versions that have user relationship
-        api_keys = [loaded_keys[str(k.id)] for k in api_keys if str(k.id) in loaded_keys]
-
     set_permission_used(http_request, "sinas.api_keys.read")
 
-    # Sort by created_at desc
-    api_keys_sorted = sorted(api_keys, key=lambda k: k.created_at, reverse=True)
-
     # Build response with user email for admins
-    responses = []
-    for key in api_keys_sorted:
-        response_data = APIKeyResponse.model_validate(key).model_dump()
-        # Add user email if viewing with :all scope (admin)
-        if key.user:
-            response_data["user_email"] = key.user.email
-        responses.append(APIKeyResponse(**response_data))
-
-    return responses
+    return [
+        from_orm_fast(APIKeyResponse, key, user_email=key.user.email if key.user else None)
+        for key in api_keys
+    ]
 
 
 @router.get("/api-keys/{key_id}", response_model=APIKeyResponse)
@@ -32,8 +32,8 @@ async def install_dependency(
         raise HTTPException(status_code=403, detail="Package installation is disabled")
 
     # Check whitelist if configured
-    if settings.allowed_packages:
-        whitelist = {pkg.strip() for pkg in settings.allowed_packages.split(",")}
+    whitelist = settings.allowed_packages_set
+    if whitelist:
         if package_data.package_name not in whitelist:
             raise HTTPException(
                 status_code=403,
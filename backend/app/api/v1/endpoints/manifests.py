@@ -9,6 +9,7 @@ from app.core.database import get_db
 from app.core.permissions import check_permission
 from app.models.manifest import Manifest
 from app.schemas.manifest import ManifestCreate, ManifestResponse, ManifestUpdate
+from app.services.manifest_cache import invalidate_manifest_cache_on_commit
 from app.services.package_service import detach_if_package_managed
 
 router = APIRouter(prefix="/manifests", tags=["manifests"])
@@ -171,6 +172,7 @@ async def update_manifest(
         manifest.is_active = manifest_data.is_active
 
     await db.flush()
+    invalidate_manifest_cache_on_commit(db)
     await db.refresh(manifest)
 
     return ManifestResponse.model_validate(manifest)
@@ -200,5 +202,6 @@ async def delete_manifest(
 
     await db.delete(manifest)
     await db.flush()
+    invalidate_manifest_cache_on_commit(db)
 
     return None
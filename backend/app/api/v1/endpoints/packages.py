@@ -1,5 +1,5 @@
 """Packages API endpoints — installable integration packages."""
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -102,6 +102,8 @@ async def create_package(
 @router.get("", response_model=list[PackageListResponse])
 async def list_packages(
     request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user_data: tuple = Depends(get_current_user_with_permissions),
 ):
@@ -114,7 +116,7 @@ async def list_packages(
     set_permission_used(request, "sinas.packages.read:own", has_perm=True)
 
     service = PackageService(db)
-    return await service.list_packages()
+    return await service.list_packages(skip=skip, limit=limit)
 
 
 @router.get("/{name}", response_model=PackageResponse)
@@ -1,18 +1,27 @@
 """Skills API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import and_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.core.auth import get_current_user_with_permissions, set_permission_used
 from app.core.database import get_db
 from app.core.permissions import check_permission
 from app.models.skill import Skill
-from app.schemas import SkillCreate, SkillResponse, SkillUpdate
+from app.schemas import SkillCreate, SkillListResponse, SkillResponse, SkillUpdate
 from app.services.package_service import detach_if_package_managed
+from app.utils.etag import not_modified, resource_etag
+from app.utils.orm import from_orm_fast
 
 router = APIRouter(prefix="/skills", tags=["skills"])
 
+# Validates/serializes a whole page in one pydantic-core call; list_skills
+# returns the encoded bytes so FastAPI doesn't re-validate against response_model
+_skill_list = TypeAdapter(list[SkillListResponse])
+
 
 @router.post("", response_model=SkillResponse, status_code=status.HTTP_201_CREATED)
 async def create_skill(
@@ -31,18 +40,6 @@ async def create_skill(
         raise HTTPException(status_code=403, detail="Not authorized to create skills")
     set_permission_used(request, permission)
 
-    # Check if skill name already exists in this namespace
-    result = await db.execute(
-        select(Skill).where(
-            and_(Skill.namespace == skill_data.namespace, Skill.name == skill_data.name)
-        )
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=400,
-            detail=f"Skill '{skill_data.namespace}/{skill_data.name}' already exists",
-        )
-
     # Create skill
     skill = Skill(
         user_id=user_id,
@@ -53,16 +50,29 @@ async def create_skill(
     )
 
     db.add(skill)
-    await db.flush()
-    await db.refresh(skill)
+    # Uniqueness is enforced by uq_skill_namespace_name — no pre-check SELECT
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # Only the namespace/name unique violation is a conflict; FK errors aren't
+        if "uq_skill_namespace_name" not in str(e.orig):
+            raise
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Skill '{skill_data.namespace}/{skill_data.name}' already exists",
+        ) from e
 
-    return SkillResponse.model_validate(skill)
+    return skill
 
 
-@router.get("", response_model=list[SkillResponse])
+@router.get("", response_model=list[SkillListResponse])
 async def list_skills(
     request: Request,
     namespace: str = None,
+    include_content: bool = Query(True, description="Set false to omit skill content"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user_data=Depends(get_current_user_with_permissions),
 ):
@@ -80,11 +90,19 @@ async def list_skills(
         permissions=permissions,
         action="read",
         additional_filters=additional_filters,
+        skip=skip,
+        limit=limit,
+        options=None if include_content else [defer(Skill.content)],
     )
 
     set_permission_used(request, "sinas.skills.read")
 
-    return [SkillResponse.model_validate(skill) for skill in skills]
+    if not include_content:
+        # content is deferred: don't touch it, or it lazy-loads per row
+        items = [from_orm_fast(SkillListResponse, skill, content=None) for skill in skills]
+    else:
+        items = _skill_list.validate_python(skills, from_attributes=True)
+    return Response(content=_skill_list.dump_json(items), media_type="application/json")
 
 
 @router.get("/{namespace}/{name}", response_model=SkillResponse)
@@ -92,6 +110,7 @@ async def get_skill(
     namespace: str,
     name: str,
     request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user_data=Depends(get_current_user_with_permissions),
 ):
@@ -110,7 +129,12 @@ async def get_skill(
 
     set_permission_used(request, f"sinas.skills/{namespace}/{name}.read")
 
-    return SkillResponse.model_validate(skill)
+    etag = resource_etag(skill.id, skill.updated_at or skill.created_at)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    response.headers["ETag"] = etag
+    return skill
 
 
 @router.put("/{namespace}/{name}", response_model=SkillResponse)
@@ -139,21 +163,9 @@ async def update_skill(
 
     detach_if_package_managed(skill)
 
-    # If namespace or name is being updated, check for conflicts
     new_namespace = skill_data.namespace or skill.namespace
     new_name = skill_data.name or skill.name
 
-    if new_namespace != skill.namespace or new_name != skill.name:
-        result = await db.execute(
-            select(Skill).where(
-                and_(Skill.namespace == new_namespace, Skill.name == new_name, Skill.id != skill.id)
-            )
-        )
-        if result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=400, detail=f"Skill '{new_namespace}/{new_name}' already exists"
-            )
-
     # Update fields
     if skill_data.namespace is not None:
         skill.namespace = skill_data.namespace
@@ -166,10 +178,20 @@ async def update_skill(
     if skill_data.is_active is not None:
         skill.is_active = skill_data.is_active
 
-    await db.flush()
-    await db.refresh(skill)
+    # Rename conflicts surface from uq_skill_namespace_name; updated_at comes
+    # back via RETURNING (eager_defaults), so no refresh SELECT
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # Only the namespace/name unique violation is a conflict; FK errors aren't
+        if "uq_skill_namespace_name" not in str(e.orig):
+            raise
+        await db.rollback()
+        raise HTTPException(
+            status_code=400, detail=f"Skill '{new_namespace}/{new_name}' already exists"
+        ) from e
 
-    return SkillResponse.model_validate(skill)
+    return skill
 
 
 @router.delete("/{namespace}/{name}", status_code=204)
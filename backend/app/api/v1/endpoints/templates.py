@@ -1,9 +1,15 @@
 """Template endpoints."""
+import asyncio
 import uuid
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import and_, select
+import jsonschema
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.core.auth import get_current_user_with_permissions, set_permission_used
 from app.core.database import get_db
@@ -13,14 +19,26 @@ from app.services.package_service import detach_if_package_managed
 from app.services.template_renderer import render_template
 from app.schemas.template import (
     TemplateCreate,
+    TemplateListResponse,
     TemplateRenderRequest,
     TemplateRenderResponse,
     TemplateResponse,
     TemplateUpdate,
 )
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.etag import not_modified, resource_etag
+from app.utils.orm import from_orm_fast
+from app.utils.schema import validate_cached
 
 router = APIRouter()
 
+# Combined template source size above which previews render in a worker thread
+RENDER_OFFLOAD_THRESHOLD = 64 * 1024
+
+# Serializes a whole page in one pydantic-core call; list_templates returns the
+# encoded bytes so FastAPI doesn't re-validate against response_model
+_template_list = TypeAdapter(list[TemplateListResponse])
+
 
 @router.post("", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
 async def create_template(
@@ -41,18 +59,6 @@ async def create_template(
         raise HTTPException(status_code=403, detail="Not authorized to create templates")
     set_permission_used(req, perm)
 
-    # Check if template namespace+name already exists
-    result = await db.execute(
-        select(Template).where(
-            and_(Template.namespace == template_data.namespace, Template.name == template_data.name)
-        )
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=400,
-            detail=f"Template '{template_data.namespace}/{template_data.name}' already exists",
-        )
-
     template = Template(
         namespace=template_data.namespace,
         name=template_data.name,
@@ -68,38 +74,85 @@ async def create_template(
     )
 
     db.add(template)
-    await db.flush()
-    await db.refresh(template)
+    # Uniqueness is enforced by uix_template_namespace_name — no pre-check SELECT
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # Only the namespace/name unique violation is a conflict; FK errors aren't
+        if "uix_template_namespace_name" not in str(e.orig):
+            raise
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Template '{template_data.namespace}/{template_data.name}' already exists",
+        ) from e
 
-    return TemplateResponse.model_validate(template)
+    return template
 
 
-@router.get("", response_model=list[TemplateResponse])
+@router.get("", response_model=list[TemplateListResponse])
 async def list_templates(
     req: Request,
+    include_content: bool = Query(
+        True, description="Set false to omit html_content and text_content"
+    ),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous page's X-Next-Cursor header (replaces skip)"
+    ),
     current_user_data: tuple = Depends(get_current_user_with_permissions),
     db: AsyncSession = Depends(get_db),
 ):
-    """List templates accessible to the current user."""
+    """
+    List templates accessible to the current user, newest first.
+
+    Full pages set an X-Next-Cursor header; pass it back as ?cursor= to fetch
+    the next page without the cost of a deep OFFSET.
+    """
     user_id, permissions = current_user_data
 
+    keyset = None
+    if cursor:
+        keyset = tuple_(Template.created_at, Template.id) < decode_cursor(cursor)
+        skip = 0
+
+    # Leave the (potentially large) bodies out of the query when not wanted
+    content_options = (
+        None if include_content else [defer(Template.html_content), defer(Template.text_content)]
+    )
+
     # Use mixin for permission-aware filtering
     templates = await Template.list_with_permissions(
         db=db,
         user_id=user_id,
         permissions=permissions,
         action="read",
+        additional_filters=keyset,
+        skip=skip,
+        limit=limit,
+        options=content_options,
+        order_by=(Template.created_at.desc(), Template.id.desc()),
     )
 
     set_permission_used(req, "sinas.templates.read")
 
-    return [TemplateResponse.model_validate(t) for t in templates]
+    # Rows were validated on write, so build items without re-validating. Deferred
+    # content columns are overridden rather than touched, or they lazy-load per row
+    overrides = {} if include_content else {"html_content": None, "text_content": None}
+    items = [from_orm_fast(TemplateListResponse, t, **overrides) for t in templates]
+    response = Response(content=_template_list.dump_json(items), media_type="application/json")
+    if len(templates) == limit:
+        last = templates[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    return response
 
 
 @router.get("/{template_id}", response_model=TemplateResponse)
 async def get_template(
     template_id: uuid.UUID,
     req: Request,
+    response: Response,
     current_user_data: tuple = Depends(get_current_user_with_permissions),
     db: AsyncSession = Depends(get_db),
 ):
@@ -107,8 +160,7 @@ async def get_template(
     user_id, permissions = current_user_data
 
     # Load template
-    result = await db.execute(select(Template).where(Template.id == template_id))
-    template = result.scalar_one_or_none()
+    template = await db.get(Template, template_id)
 
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -119,7 +171,13 @@ async def get_template(
         raise HTTPException(status_code=403, detail="Not authorized to get this template")
 
     set_permission_used(req, f"sinas.templates/{template.namespace}/{template.name}.read")
-    return TemplateResponse.model_validate(template)
+
+    etag = resource_etag(template.id, template.updated_at)
+    cached = not_modified(req, etag)
+    if cached is not None:
+        return cached
+    response.headers["ETag"] = etag
+    return template
 
 
 @router.get("/by-name/{namespace}/{name}", response_model=TemplateResponse)
@@ -127,6 +185,7 @@ async def get_template_by_name(
     namespace: str,
     name: str,
     req: Request,
+    response: Response,
     current_user_data: tuple = Depends(get_current_user_with_permissions),
     db: AsyncSession = Depends(get_db),
 ):
@@ -144,7 +203,13 @@ async def get_template_by_name(
     )
 
     set_permission_used(req, f"sinas.templates/{namespace}/{name}.read")
-    return TemplateResponse.model_validate(template)
+
+    etag = resource_etag(template.id, template.updated_at)
+    cached = not_modified(req, etag)
+    if cached is not None:
+        return cached
+    response.headers["ETag"] = etag
+    return template
 
 
 @router.patch("/{template_id}", response_model=TemplateResponse)
@@ -160,8 +225,7 @@ async def update_template(
     user_uuid = uuid.UUID(user_id)
 
     # Load template
-    result = await db.execute(select(Template).where(Template.id == template_id))
-    template = result.scalar_one_or_none()
+    template = await db.get(Template, template_id)
 
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -175,23 +239,8 @@ async def update_template(
 
     detach_if_package_managed(template)
 
-    # Check for namespace/name conflict if renaming
     new_namespace = template_data.namespace or template.namespace
     new_name = template_data.name or template.name
-    if new_namespace != template.namespace or new_name != template.name:
-        result = await db.execute(
-            select(Template).where(
-                and_(
-                    Template.namespace == new_namespace,
-                    Template.name == new_name,
-                    Template.id != template_id,
-                )
-            )
-        )
-        if result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=400, detail=f"Template '{new_namespace}/{new_name}' already exists"
-            )
 
     # Update fields
     for field, value in template_data.model_dump(exclude_unset=True).items():
@@ -199,10 +248,20 @@ async def update_template(
 
     template.updated_by = user_uuid
 
-    await db.flush()
-    await db.refresh(template)
+    # Rename conflicts surface from uix_template_namespace_name; updated_at
+    # comes back via RETURNING (eager_defaults), so no refresh SELECT
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # Only the namespace/name unique violation is a conflict; FK errors aren't
+        if "uix_template_namespace_name" not in str(e.orig):
+            raise
+        await db.rollback()
+        raise HTTPException(
+            status_code=400, detail=f"Template '{new_namespace}/{new_name}' already exists"
+        ) from e
 
-    return TemplateResponse.model_validate(template)
+    return template
 
 
 @router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -216,8 +275,7 @@ async def delete_template(
     user_id, permissions = current_user_data
 
     # Load template
-    result = await db.execute(select(Template).where(Template.id == template_id))
-    template = result.scalar_one_or_none()
+    template = await db.get(Template, template_id)
 
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -233,6 +291,23 @@ async def delete_template(
     await db.flush()
 
 
+def _source_size(template: Template) -> int:
+    sources = (template.title, template.html_content, template.text_content)
+    return sum(len(src) for src in sources if src)
+
+
+def _render_preview(title, html_content, text_content, variable_schema, variables):
+    """Validate variables and render all template parts; returns (title, html, text)."""
+    # Validate variables against schema if defined
+    if variable_schema:
+        validate_cached(variables, variable_schema)
+
+    rendered_title = render_template(title, variables) if title else None
+    rendered_html = render_template(html_content, variables)
+    rendered_text = render_template(text_content, variables) if text_content else None
+    return rendered_title, rendered_html, rendered_text
+
+
 @router.post("/{template_id}/render", response_model=TemplateRenderResponse)
 async def render_template_preview(
     template_id: uuid.UUID,
@@ -245,8 +320,7 @@ async def render_template_preview(
     user_id, permissions = current_user_data
 
     # Load template
-    result = await db.execute(select(Template).where(Template.id == template_id))
-    template = result.scalar_one_or_none()
+    template = await db.get(Template, template_id)
 
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -259,33 +333,26 @@ async def render_template_preview(
     set_permission_used(req, f"sinas.templates/{template.namespace}/{template.name}.render")
 
     # Render template using inline rendering (don't need to look up by name again)
+    args = (
+        template.title,
+        template.html_content,
+        template.text_content,
+        template.variable_schema,
+        render_request.variables,
+    )
     try:
-        # Validate variables against schema if defined
-        if template.variable_schema:
-            import jsonschema
-
-            try:
-                jsonschema.validate(render_request.variables, template.variable_schema)
-            except jsonschema.ValidationError as e:
-                raise HTTPException(
-                    status_code=400, detail=f"Variable validation failed: {e.message}"
-                )
-
-        # Render title
-        rendered_title = None
-        if template.title:
-            rendered_title = render_template(template.title, render_request.variables)
-
-        # Render HTML
-        rendered_html = render_template(template.html_content, render_request.variables)
-
-        # Render text
-        rendered_text = None
-        if template.text_content:
-            rendered_text = render_template(template.text_content, render_request.variables)
-
-        return TemplateRenderResponse(
-            title=rendered_title, html_content=rendered_html, text_content=rendered_text
-        )
+        # Large templates render in a worker thread so they don't stall the event loop
+        if _source_size(template) > RENDER_OFFLOAD_THRESHOLD:
+            rendered_title, rendered_html, rendered_text = await asyncio.to_thread(
+                _render_preview, *args
+            )
+        else:
+            rendered_title, rendered_html, rendered_text = _render_preview(*args)
+    except jsonschema.ValidationError as e:
+        raise HTTPException(status_code=400, detail=f"Variable validation failed: {e.message}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Template rendering failed: {str(e)}")
+
+    return TemplateRenderResponse(
+        title=rendered_title, html_content=rendered_html, text_content=rendered_text
+    )
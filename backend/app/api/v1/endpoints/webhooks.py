@@ -11,6 +11,7 @@ from app.models.function import Function
 from app.models.webhook import Webhook
 from app.schemas import WebhookCreate, WebhookResponse, WebhookUpdate
 from app.services.package_service import detach_if_package_managed
+from app.services.webhook_cache import invalidate_webhook_cache_on_commit
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
@@ -67,6 +68,7 @@ async def create_webhook(
     db.add(webhook)
     await db.flush()
     await db.refresh(webhook)
+    invalidate_webhook_cache_on_commit(db)
 
     response = WebhookResponse.model_validate(webhook)
 
@@ -203,6 +205,7 @@ async def update_webhook(
         webhook.dedup = webhook_data.dedup.model_dump()
     await db.flush()
     await db.refresh(webhook)
+    invalidate_webhook_cache_on_commit(db)
 
     response = WebhookResponse.model_validate(webhook)
 
@@ -235,5 +238,6 @@ async def delete_webhook(
 
     await db.delete(webhook)
     await db.flush()
+    invalidate_webhook_cache_on_commit(db)
 
     return None
@@ -18,6 +18,7 @@ from app.core.database import AsyncSessionLocal, get_db
 from app.core.email import send_otp_email_async
 from app.core.permissions import (
     DEFAULT_ROLE_PERMISSIONS,
+    GrantedPermissions,
     check_permission,
     validate_permission_subset,
 )
@@ -44,9 +45,9 @@ def generate_otp_code(length: int = 6) -> str:
     return "".join(random.choices(string.digits, k=length))
 
 
-async def create_otp_session(db: AsyncSession, email: str) -> OTPSession:
+async def create_otp_session_record(db: AsyncSession, email: str) -> OTPSession:
     """
-    Create a new OTP session and send the code via email.
+    Create a new OTP session without sending the code.
 
     Args:
         db: Database session
@@ -70,12 +71,35 @@ async def create_otp_session(db: AsyncSession, email: str) -> OTPSession:
     await db.commit()
     await db.refresh(otp_session)
 
-    # Send OTP email
-    await send_otp_email_async(db, email, otp_code)
-
     return otp_session
 
 
+async def send_otp_email(session_id: uuid_lib.UUID, email: str) -> None:
+    """
+    Send the code of an OTP session via email.
+
+    Runs as a background task after the login response has been returned, so
+    it uses its own DB session and logs delivery failures instead of raising.
+
+    Args:
+        session_id: OTP session ID
+        email: Address as entered by the user
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(OTPSession).where(OTPSession.id == session_id))
+            otp_session = result.scalar_one_or_none()
+            if not otp_session:
+                return
+            await send_otp_email_async(db, email, otp_session.otp_code)
+    except Exception as e:
+        logger.error(f"Failed to send OTP email to {email}: {e}")
+
+
 async def verify_otp_code(db: AsyncSession, session_id: str, otp_code: str) -> Optional[OTPSession]:
     """
     Verify an OTP code against a session.
@@ -149,29 +173,21 @@ async def get_user_permissions(db: AsyncSession, user_id: str) -> dict[str, bool
     Returns:
         Dictionary of permission_key: bool
     """
-    # Get all active role memberships
+    # Permissions of all active role memberships, in one round-trip
     result = await db.execute(
-        select(UserRole).where(UserRole.user_id == user_id, UserRole.active == True)
+        select(RolePermission.permission_key, RolePermission.permission_value)
+        .join(UserRole, UserRole.role_id == RolePermission.role_id)
+        .where(UserRole.user_id == user_id, UserRole.active == True)
     )
-    memberships = result.scalars().all()
-
-    if not memberships:
-        return {}
 
     # Collect all permissions from all roles
-    all_permissions = {}
+    all_permissions = GrantedPermissions()
 
-    for membership in memberships:
-        result = await db.execute(
-            select(RolePermission).where(RolePermission.role_id == membership.role_id)
-        )
-        role_permissions = result.scalars().all()
-
-        for perm in role_permissions:
-            # OR logic: if ANY role grants permission (true), user has it
-            # Don't let a false permission override an existing true permission
-            if perm.permission_value or perm.permission_key not in all_permissions:
-                all_permissions[perm.permission_key] = perm.permission_value
+    for permission_key, permission_value in result:
+        # OR logic: if ANY role grants permission (true), user has it
+        # Don't let a false permission override an existing true permission
+        if permission_value or permission_key not in all_permissions:
+            all_permissions[permission_key] = permission_value
 
     # Return permissions as-is (with wildcards) - they will be matched at runtime
     return all_permissions
@@ -442,7 +458,7 @@ async def validate_api_key(db: AsyncSession, key: str) -> Optional[tuple[User, d
     user.last_login_at = datetime.now(UTC)
     await db.commit()
 
-    return user, api_key.permissions
+    return user, GrantedPermissions(api_key.permissions)
 
 
 # Authentication Dependencies
@@ -452,6 +468,7 @@ http_bearer = HTTPBearer(auto_error=False)
 
 
 async def verify_jwt_or_api_key(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
     x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
     db: AsyncSession = Depends(get_db),
@@ -467,6 +484,9 @@ async def verify_jwt_or_api_key(
     - Bearer <api_key> (long-lived) in Authorization header
     - <api_key> in X-API-Key header
 
+    The loaded User is stored on request.state.current_user so endpoints
+    that need the user record (e.g. /auth/me) don't fetch it again.
+
     Returns:
         Tuple of (user_id, email, permissions)
 
@@ -505,6 +525,7 @@ async def verify_jwt_or_api_key(
         if not user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
+        request.state.current_user = user
         return str(user_id), email, permissions
 
     except JWTError:
@@ -517,6 +538,7 @@ async def verify_jwt_or_api_key(
             )
 
         user, permissions = result
+        request.state.current_user = user
         return str(user.id), user.email, permissions
 
 
@@ -595,7 +617,9 @@ async def get_current_user_optional(
 
     try:
         async with AsyncSessionLocal() as db:
-            user_id, email, _ = await verify_jwt_or_api_key(credentials, db)
+            user_id, email, _ = await verify_jwt_or_api_key(
+                request=request, credentials=credentials, x_api_key=None, db=db
+            )
             await db.commit()
             # Store user info in request state for logging
             request.state.user_id = user_id
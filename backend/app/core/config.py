@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -57,12 +58,19 @@ class Settings(BaseSettings):
     rate_limit_otp_ip_max: int = 10  # Max OTP verify requests per IP per window
     rate_limit_window_seconds: int = 900  # Rate limit window (15 minutes)
 
+    # Response caching
+    # Seconds to cache per-user discovery listings in Redis (0 = off). Entries are
+    # dropped when a listed resource is written through the API; the TTL bounds
+    # staleness for anything else (e.g. writes made directly in the database)
+    discovery_cache_ttl: int = 0
+
     # SMTP Configuration (for sending emails)
     smtp_host: Optional[str] = None
     smtp_port: int = 587
     smtp_user: Optional[str] = None
     smtp_password: Optional[str] = None
     smtp_domain: Optional[str] = None  # Used for "from" email: login@{smtp_domain}
+    smtp_pool_size: int = 4  # Idle authenticated connections kept per process (0 = no reuse)
 
     # SMTP Server Configuration (for receiving emails)
     smtp_server_host: str = "0.0.0.0"
@@ -75,6 +83,7 @@ class Settings(BaseSettings):
     max_function_storage: str = "1g"  # Disk storage limit (e.g., "500m", "1g")
     function_container_image: str = "sinas-executor"  # Base image for execution (overridden by FUNCTION_CONTAINER_IMAGE env var)
     function_container_idle_timeout: int = 3600  # Seconds before idle container cleanup (1 hour)
+    content_filter_cache_ttl: int = 0  # Seconds to reuse content filter results for identical uploads (0 = off)
 
     # Sandbox containers (isolated execution pool)
     sandbox_min_size: int = 4  # Containers to create on startup
@@ -87,9 +96,21 @@ class Settings(BaseSettings):
     allow_package_installation: bool = True
     allowed_packages: Optional[str] = None  # Comma-separated whitelist, None = all allowed
 
+    @cached_property
+    def allowed_packages_set(self) -> frozenset[str]:
+        """Parsed ALLOWED_PACKAGES whitelist (empty = all allowed), computed once."""
+        if not self.allowed_packages:
+            return frozenset()
+        return frozenset(filter(None, (pkg.strip() for pkg in self.allowed_packages.split(","))))
+
     # Database pool
     db_pool_size: int = 20  # Connection pool size
     db_max_overflow: int = 30  # Max overflow connections beyond pool_size
+    db_pool_timeout: int = 10  # Seconds to wait for a free connection before erroring
+    # Per-connection prepared statement cache (asyncpg). Relies on pgbouncer's
+    # protocol-level prepared statement support in transaction mode
+    # (max_prepared_statements > 0); set to 0 for a pgbouncer without it.
+    db_statement_cache_size: int = 1024
 
     # Docker configuration
     backend_port: int = 8000  # Port the backend listens on (for file URLs on localhost)
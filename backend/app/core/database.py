@@ -18,7 +18,15 @@ async_engine = create_async_engine(
     echo=settings.debug,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
     pool_recycle=300,  # Recycle connections every 5 min to avoid pgbouncer timeouts
+    pool_pre_ping=True,  # Replace connections dropped server-side instead of failing the request
+    query_cache_size=1024,  # Compiled SQL cache; default 500 is tight with per-model statements
+    connect_args={
+        # Reuse server-side prepared statements for repeated queries on a connection
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+    },
 )
 AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
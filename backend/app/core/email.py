@@ -1,13 +1,13 @@
 """Email utility with template support and managed mailer fallback."""
 import asyncio
 import logging
-import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import smtp_pool
 from app.core.config import settings
 from app.services.template_service import template_service
 
@@ -19,6 +19,34 @@ SMTP_TIMEOUT = 10
 # Managed mailer endpoint (used when no SMTP is configured)
 MANAGED_MAILER_URL = "https://mail.sinas.cloud/send-otp"
 
+# Built-in OTP email, used when the database has no usable otp_email template
+_OTP_FALLBACK_SUBJECT = "Your Login Code"
+_OTP_FALLBACK_HTML = """
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+        <h2 style="color: #333;">Your Login Code</h2>
+        <p>Hello,</p>
+        <p>Your login verification code is:</p>
+        <div style="background-color: #f8f9fa; padding: 20px; text-align: center; margin: 20px 0; border-radius: 8px;">
+            <h1 style="color: #007bff; font-size: 32px; margin: 0; letter-spacing: 8px;">{otp_code}</h1>
+        </div>
+        <p>This code will expire in {expiry_minutes} minutes.</p>
+        <p>If you didn't request this code, please ignore this email.</p>
+    </div>
+        """
+_OTP_FALLBACK_TEXT = (
+    "Your login code is: {otp_code}\n\nThis code expires in {expiry_minutes} minutes."
+)
+
+
+def _render_fallback_otp(otp_code: str) -> tuple[str, str, str]:
+    """(subject, html, text) for the built-in OTP email."""
+    expiry_minutes = settings.otp_expire_minutes
+    return (
+        _OTP_FALLBACK_SUBJECT,
+        _OTP_FALLBACK_HTML.format(otp_code=otp_code, expiry_minutes=expiry_minutes),
+        _OTP_FALLBACK_TEXT.format(otp_code=otp_code, expiry_minutes=expiry_minutes),
+    )
+
 
 def _send_email_sync(
     email: str, subject: str, html_content: str, text_content: str, settings
@@ -36,11 +64,8 @@ def _send_email_sync(
     msg.attach(part1)
     msg.attach(part2)
 
-    with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=SMTP_TIMEOUT) as server:
-        server.starttls()
-        if settings.smtp_user and settings.smtp_password:
-            server.login(settings.smtp_user, settings.smtp_password)
-        server.send_message(msg)
+    # Reuses an already-authenticated connection when one is pooled
+    smtp_pool.send_message(settings, msg, timeout=SMTP_TIMEOUT)
 
 
 async def _send_via_managed_mailer(email: str, otp_code: str) -> None:
@@ -119,20 +144,7 @@ async def _send_via_user_smtp(db: AsyncSession, email: str, otp_code: str) -> No
 
     # Fallback template
     if not subject:
-        subject = "Your Login Code"
-        html_content = f"""
-    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-        <h2 style="color: #333;">Your Login Code</h2>
-        <p>Hello,</p>
-        <p>Your login verification code is:</p>
-        <div style="background-color: #f8f9fa; padding: 20px; text-align: center; margin: 20px 0; border-radius: 8px;">
-            <h1 style="color: #007bff; font-size: 32px; margin: 0; letter-spacing: 8px;">{otp_code}</h1>
-        </div>
-        <p>This code will expire in {settings.otp_expire_minutes} minutes.</p>
-        <p>If you didn't request this code, please ignore this email.</p>
-    </div>
-        """
-        text_content = f"Your login code is: {otp_code}\n\nThis code expires in {settings.otp_expire_minutes} minutes."
+        subject, html_content, text_content = _render_fallback_otp(otp_code)
 
     try:
         await asyncio.wait_for(
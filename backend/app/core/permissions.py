@@ -1,6 +1,11 @@
 """Permission management utilities."""
+from functools import lru_cache
+from typing import Optional
 
 
+# Pure function of two strings, called for every (granted, required) pair on
+# each check_permission; memoize so a role's patterns are only parsed once.
+@lru_cache(maxsize=8192)
 def matches_permission_pattern(pattern: str, concrete: str) -> bool:
     """
     Check if a concrete permission matches a wildcard pattern.
@@ -158,6 +163,26 @@ def matches_permission_pattern(pattern: str, concrete: str) -> bool:
     return True
 
 
+class GrantedPermissions(dict):
+    """
+    A user's resolved permission dict, as returned for a request.
+
+    Carries the grant index check_permission needs, built on first use, so the
+    many checks made while serving one request don't each re-derive it from
+    every granted key. Treat as read-only once checks have started.
+    """
+
+    _grant_index: Optional[tuple[dict[str, tuple[str, ...]], tuple[str, ...]]] = None
+
+    @property
+    def grant_index(self) -> tuple[dict[str, tuple[str, ...]], tuple[str, ...]]:
+        if self._grant_index is None:
+            self._grant_index = _index_grants(
+                frozenset(perm for perm, has_perm in self.items() if has_perm)
+            )
+        return self._grant_index
+
+
 def check_permission(permissions: dict[str, bool], required_permission: str) -> bool:
     """
     Check if user has a permission, supporting wildcard matching and scope hierarchy.
@@ -199,15 +224,67 @@ def check_permission(permissions: dict[str, bool], required_permission: str) ->
     if permissions.get(required_permission):
         return True
 
-    # Check all user permissions (wildcard AND non-wildcard) using pattern matching
-    # This handles both wildcards and scope hierarchy
-    for user_perm, has_perm in permissions.items():
-        if has_perm and matches_permission_pattern(user_perm, required_permission):
+    # Only patterns that can possibly match this resource type are tried: those
+    # for the same <service>.<resource_type> plus the wildcard ones. This handles
+    # both wildcards and scope hierarchy
+    if isinstance(permissions, GrantedPermissions):
+        by_base, wildcards = permissions.grant_index
+    else:
+        by_base, wildcards = _index_grants(
+            frozenset(perm for perm, has_perm in permissions.items() if has_perm)
+        )
+    for user_perm in by_base.get(_resource_base(required_permission), ()):
+        if matches_permission_pattern(user_perm, required_permission):
+            return True
+    for user_perm in wildcards:
+        if matches_permission_pattern(user_perm, required_permission):
             return True
 
     return False
 
 
+def _resource_base(permission: str) -> Optional[str]:
+    """
+    The <service>.<resource_type> part of a permission, parsed the same way as
+    matches_permission_pattern ("sinas.functions/ns/name.execute:own" -> "sinas.functions").
+    None if the permission is malformed.
+    """
+    parts, sep, _scope = permission.rpartition(":")
+    if not sep:
+        return None
+    resource, sep, _action = parts.rpartition(".")
+    if not sep:
+        return None
+    return resource.split("/", 1)[0]
+
+
+@lru_cache(maxsize=1024)
+def _index_grants(
+    grants: frozenset[str],
+) -> tuple[dict[str, tuple[str, ...]], tuple[str, ...]]:
+    """
+    Group granted patterns by the resource type they can match.
+
+    Patterns with a concrete base and action only ever match that exact base, so
+    they are bucketed under it. Patterns with a wildcard in the base, or a
+    wildcard action (which also matches longer bases by prefix), can match
+    anything and are returned separately. Cached per distinct permission set,
+    which is shared by every user holding the same roles.
+    """
+    by_base: dict[str, list[str]] = {}
+    wildcards = []
+    for perm in grants:
+        base = _resource_base(perm)
+        if base is None:
+            continue  # Malformed - never matches
+        action = perm.rpartition(":")[0].rpartition(".")[2]
+        if "*" in base or action == "*":
+            wildcards.append(perm)
+        else:
+            by_base.setdefault(base, []).append(perm)
+    return {base: tuple(perms) for base, perms in by_base.items()}, tuple(wildcards)
+
+
 def validate_permission_subset(
     subset_perms: dict[str, bool], superset_perms: dict[str, bool]
 ) -> tuple[bool, list[str]]:
@@ -0,0 +1,125 @@
+"""Per-process pool of authenticated SMTP connections.
+
+Connecting, STARTTLS and login dominate the cost of sending a single email.
+Sends run in worker threads, so connections are kept in a thread-safe pool and
+handed out one caller at a time. Idle connections the server has since dropped
+are detected with NOOP on checkout and replaced.
+"""
+import logging
+import smtplib
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _SMTP(smtplib.SMTP):
+    """SMTP connection that tracks whether it was reused and a message handed over."""
+
+    reused = False
+    data_sent = False
+
+    def data(self, msg):
+        # Set before DATA goes out: from here on a disconnect may follow delivery
+        self.data_sent = True
+        return super().data(msg)
+
+
+_pool: deque[tuple[tuple, _SMTP]] = deque()
+_lock = threading.Lock()
+
+
+def _pool_key(settings) -> tuple:
+    return (settings.smtp_host, settings.smtp_port, settings.smtp_user)
+
+
+def _connect(settings, timeout: float) -> _SMTP:
+    server = _SMTP(settings.smtp_host, settings.smtp_port, timeout=timeout)
+    try:
+        server.starttls()
+        if settings.smtp_user and settings.smtp_password:
+            server.login(settings.smtp_user, settings.smtp_password)
+    except Exception:
+        _close(server)
+        raise
+    return server
+
+
+def _close(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def _is_alive(server: smtplib.SMTP) -> bool:
+    try:
+        return server.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+def _checkout(settings) -> Optional[_SMTP]:
+    """Pop a live pooled connection for these settings, discarding stale ones."""
+    key = _pool_key(settings)
+    while True:
+        with _lock:
+            if not _pool:
+                return None
+            pooled_key, server = _pool.pop()
+        if pooled_key == key and _is_alive(server):
+            return server
+        _close(server)
+
+
+def _checkin(settings, server: _SMTP) -> None:
+    with _lock:
+        if len(_pool) < settings.smtp_pool_size:
+            _pool.append((_pool_key(settings), server))
+            return
+    _close(server)
+
+
+@contextmanager
+def smtp_connection(settings, timeout: float) -> Iterator[_SMTP]:
+    """
+    Borrow an authenticated SMTP connection.
+
+    The connection goes back to the pool if the block succeeds and is dropped
+    if it raises, so a broken connection is never reused.
+    """
+    server = _checkout(settings)
+    reused = server is not None
+    if not reused:
+        server = _connect(settings, timeout)
+    server.reused = reused
+    server.data_sent = False
+    try:
+        yield server
+    except Exception:
+        _close(server)
+        raise
+    _checkin(settings, server)
+
+
+def send_message(settings, msg, timeout: float) -> None:
+    """
+    Send msg over a pooled connection.
+
+    A reused connection dropped before DATA is retried once on another one;
+    any later disconnect propagates, since the server may already have
+    accepted the message and a resend could deliver it twice.
+    """
+    server = None
+    try:
+        with smtp_connection(settings, timeout) as server:
+            server.send_message(msg)
+    except smtplib.SMTPServerDisconnected:
+        if server is None or not server.reused or server.data_sent:
+            raise
+        logger.debug("Pooled SMTP connection was dropped before sending; reconnecting")
+        with smtp_connection(settings, timeout) as server:
+            server.send_message(msg)
@@ -1,7 +1,7 @@
 """Default template initialization."""
 import logging
 
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.template import Template
@@ -9,23 +9,15 @@ from app.models.template import Template
 logger = logging.getLogger(__name__)
 
 
-async def initialize_default_templates(db: AsyncSession):
-    """
-    Initialize default templates (OTP email, etc.) if they don't exist.
-
-    Called during application startup.
-    """
+# Seeded once per (namespace, name); edits made after seeding are never overwritten
+DEFAULT_TEMPLATES = [
     # OTP Email Template
-    otp_template_name = "otp_email"
-    result = await db.execute(select(Template).where(Template.name == otp_template_name))
-    existing = result.scalar_one_or_none()
-
-    if not existing:
-        otp_template = Template(
-            name=otp_template_name,
-            description="OTP verification email template",
-            title="Your Login Code",
-            html_content="""
+    {
+        "namespace": "default",
+        "name": "otp_email",
+        "description": "OTP verification email template",
+        "title": "Your Login Code",
+        "html_content": """
 <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
     <h2 style="color: #333;">Your Login Code</h2>
     <p>Hello,</p>
@@ -37,8 +29,8 @@ async def initialize_default_templates(db: AsyncSession):
     <p>If you didn't request this code, please ignore this email.</p>
     <p>Best regards,<br>Sinas</p>
 </div>
-            """.strip(),
-            text_content="""
+        """.strip(),
+        "text_content": """
 Your Login Code
 
 Hello,
@@ -51,27 +43,45 @@ If you didn't request this code, please ignore this email.
 
 Best regards,
 SINAS Team
-            """.strip(),
-            variable_schema={
-                "type": "object",
-                "properties": {
-                    "otp_code": {"type": "string", "description": "6-digit OTP verification code"},
-                    "user_email": {
-                        "type": "string",
-                        "format": "email",
-                        "description": "User's email address",
-                    },
-                    "expiry_minutes": {
-                        "type": "integer",
-                        "description": "Minutes until OTP expires",
-                    },
+        """.strip(),
+        "variable_schema": {
+            "type": "object",
+            "properties": {
+                "otp_code": {"type": "string", "description": "6-digit OTP verification code"},
+                "user_email": {
+                    "type": "string",
+                    "format": "email",
+                    "description": "User's email address",
+                },
+                "expiry_minutes": {
+                    "type": "integer",
+                    "description": "Minutes until OTP expires",
                 },
-                "required": ["otp_code", "user_email", "expiry_minutes"],
             },
-            is_active=True,
-        )
-        db.add(otp_template)
-        await db.commit()
-        logger.info(f"✅ Created default template: {otp_template_name}")
-    else:
-        logger.debug(f"Default template already exists: {otp_template_name}")
+            "required": ["otp_code", "user_email", "expiry_minutes"],
+        },
+        "is_active": True,
+    },
+]
+
+
+async def initialize_default_templates(db: AsyncSession):
+    """
+    Initialize default templates (OTP email, etc.) if they don't exist.
+
+    Called during application startup. A single INSERT ... ON CONFLICT DO NOTHING
+    covers all defaults, so concurrent workers booting at once can't race on it.
+    """
+    result = await db.execute(
+        pg_insert(Template)
+        .values(DEFAULT_TEMPLATES)
+        .on_conflict_do_nothing(index_elements=["namespace", "name"])
+        .returning(Template.name)
+    )
+    created = list(result.scalars())
+    await db.commit()
+
+    for name in created:
+        logger.info(f"✅ Created default template: {name}")
+    if not created:
+        logger.debug("Default templates already exist")
@@ -122,6 +122,8 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Paging cursors and conditional-GET validators travel in headers
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Add request logging middleware
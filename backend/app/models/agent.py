@@ -12,6 +12,7 @@ from sqlalchemy import (
     UniqueConstraint,
     select,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -89,7 +90,7 @@ class Agent(Base, PermissionMixin):
 
     # Collection access
     enabled_collections: Mapped[list[dict[str, Any]]] = mapped_column(
-        JSON, nullable=False, default=list, server_default="[]"
+        JSONB, nullable=False, default=list, server_default="[]"
     )  # List of {"collection": "namespace/name", "access": "readonly|readwrite"}
 
     # Component access
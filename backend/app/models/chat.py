@@ -21,8 +21,8 @@ class Chat(Base):
 
     title: Mapped[str] = mapped_column(String(500), nullable=False)
 
-    archived: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False, index=True)
-    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    archived: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Long-running workflow settings
     job_timeout: Mapped[Optional[int]] = mapped_column(Integer)
@@ -47,6 +47,21 @@ class Chat(Base):
             unique=True,
             postgresql_where=text("session_key IS NOT NULL AND archived = false"),
         ),
+        # Partial indexes: archived chats are the minority, active chats are listed per user
+        Index("ix_chats_archived", "archived", postgresql_where=text("archived = true")),
+        Index(
+            "ix_chats_user_id_updated_at_active",
+            "user_id",
+            "updated_at",
+            postgresql_where=text("archived = false"),
+        ),
+        # BRIN over the TTL column for the expired-chat cleanup sweep
+        Index(
+            "ix_chats_expires_at",
+            "expires_at",
+            postgresql_using="brin",
+            postgresql_where=text("expires_at IS NOT NULL"),
+        ),
     )
 
     # Relationships
@@ -2,7 +2,7 @@
 import uuid as uuid_lib
 from typing import Any, Optional
 
-from sqlalchemy import JSON, BigInteger, ForeignKey, Index, Integer, String, Text, UniqueConstraint, select, text
+from sqlalchemy import JSON, BigInteger, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -59,10 +59,30 @@ class Collection(Base, PermissionMixin):
         UniqueConstraint("namespace", "name", name="uq_collection_namespace_name"),
     )
 
+    @staticmethod
+    def _split_function_ref(ref: Optional[str]) -> Optional[tuple[str, str]]:
+        """Split a "namespace/name" function reference, or None if unset or malformed."""
+        if not ref:
+            return None
+        namespace, sep, name = ref.partition("/")
+        if not sep or not namespace or not name or "/" in name:
+            return None
+        return namespace, name
+
+    @property
+    def content_filter_ref(self) -> Optional[tuple[str, str]]:
+        """(namespace, name) of the content filter function."""
+        return self._split_function_ref(self.content_filter_function)
+
+    @property
+    def post_upload_ref(self) -> Optional[tuple[str, str]]:
+        """(namespace, name) of the post-upload function."""
+        return self._split_function_ref(self.post_upload_function)
+
     @classmethod
     async def get_by_name(cls, db: AsyncSession, namespace: str, name: str) -> Optional["Collection"]:
         """Get collection by namespace and name."""
-        result = await db.execute(select(cls).where(cls.namespace == namespace, cls.name == name))
+        result = await db.execute(cls._by_name_statement(), {"namespace": namespace, "name": name})
         return result.scalar_one_or_none()
 
 
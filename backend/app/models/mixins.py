@@ -2,7 +2,7 @@
 from typing import Optional
 
 from fastapi import HTTPException
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, bindparam, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.permissions import check_permission
@@ -55,6 +55,17 @@ class PermissionMixin:
         """Check if model has namespace field"""
         return hasattr(cls, "namespace")
 
+    @classmethod
+    def _by_name_statement(cls):
+        """SELECT by (namespace, name) with bind params, built once per model class."""
+        stmt = cls.__dict__.get("_by_name_select")
+        if stmt is None:
+            stmt = select(cls).where(
+                cls.namespace == bindparam("namespace"), cls.name == bindparam("name")
+            )
+            cls._by_name_select = stmt
+        return stmt
+
     @classmethod
     def _has_ownership(cls) -> bool:
         """Check if model has user_id field"""
@@ -65,6 +76,32 @@ class PermissionMixin:
         """Check if model has visibility field"""
         return hasattr(cls, "visibility")
 
+    @classmethod
+    def _list_permissions(cls, action: str) -> tuple[str, str]:
+        """The (:all, :own) permissions that grant listing for an action."""
+        perm_base = cls._permission_base()
+        if cls._is_namespaced():
+            # Namespaced resource: sinas.agents/*/*.read:all
+            return f"{perm_base}/*/*.{action}:all", f"{perm_base}/*/*.{action}:own"
+        # Non-namespaced: sinas.users.read:all
+        return f"{perm_base}.{action}:all", f"{perm_base}.{action}:own"
+
+    @classmethod
+    def can_list(cls, permissions: dict[str, bool], action: str) -> bool:
+        """
+        Whether list_with_permissions could return anything for these permissions.
+
+        Pure permission-dict check (no DB), for short-circuiting before any
+        other per-request work.
+        """
+        all_perm, own_perm = cls._list_permissions(action)
+        if check_permission(permissions, all_perm) or check_permission(permissions, own_perm):
+            return True
+        if not cls._is_namespaced():
+            return False
+        namespaces, resources = cls._get_accessible_scopes(permissions, action)
+        return bool(namespaces or resources)
+
     @classmethod
     async def list_with_permissions(
         cls,
@@ -75,6 +112,8 @@ class PermissionMixin:
         additional_filters=None,
         skip: int = 0,
         limit: int = 100,
+        options: Optional[list] = None,
+        order_by=None,
     ):
         """
         List resources filtered by permissions.
@@ -87,6 +126,8 @@ class PermissionMixin:
             additional_filters: Optional SQLAlchemy filter expressions
             skip: Pagination offset
             limit: Pagination limit
+            options: Optional loader options (e.g. selectinload) for the query
+            order_by: Optional ORDER BY expression (or list of them), applied before pagination
 
         Returns:
             List of resources the user can access
@@ -95,16 +136,7 @@ class PermissionMixin:
         query = select(cls)
 
         # Build permission strings
-        perm_base = cls._permission_base()
-
-        if cls._is_namespaced():
-            # Namespaced resource: sinas.agents/*/*.read:all
-            all_perm = f"{perm_base}/*/*.{action}:all"
-            own_perm = f"{perm_base}/*/*.{action}:own"
-        else:
-            # Non-namespaced: sinas.users.read:all
-            all_perm = f"{perm_base}.{action}:all"
-            own_perm = f"{perm_base}.{action}:own"
+        all_perm, own_perm = cls._list_permissions(action)
 
         has_all = check_permission(permissions, all_perm)
 
@@ -126,16 +158,26 @@ class PermissionMixin:
             else:
                 # Check for namespace-specific permissions (if namespaced)
                 if cls._is_namespaced():
-                    accessible_namespaces = cls._get_accessible_namespaces(permissions, action)
+                    namespaces, resources = cls._get_accessible_scopes(permissions, action)
+
+                    if namespaces or resources:
+                        # Namespace wildcards (ns/*) and exact grants (ns/name) are
+                        # both pushed into the WHERE clause, so the page comes back
+                        # already filtered in a single query
+                        granted = []
+                        if namespaces:
+                            granted.append(cls.namespace.in_(sorted(namespaces)))
+                        if resources:
+                            granted.append(tuple_(cls.namespace, cls.name).in_(sorted(resources)))
+                        in_scope = or_(*granted)
 
-                    if accessible_namespaces:
                         if cls._has_ownership() and cls._has_visibility():
-                            # In accessible namespaces: own + non-private
-                            # Outside accessible namespaces: own only
+                            # In accessible scope: own + non-private
+                            # Outside accessible scope: own only
                             query = query.where(
                                 or_(
                                     and_(
-                                        cls.namespace.in_(accessible_namespaces),
+                                        in_scope,
                                         or_(cls.user_id == user_id, cls.visibility != "private"),
                                     ),
                                     cls.user_id == user_id,
@@ -143,7 +185,7 @@ class PermissionMixin:
                             )
                         else:
                             # No visibility - original behavior
-                            filters = [cls.namespace.in_(accessible_namespaces)]
+                            filters = [in_scope]
                             if cls._has_ownership():
                                 filters.append(cls.user_id == user_id)
                             query = query.where(or_(*filters))
@@ -158,6 +200,14 @@ class PermissionMixin:
         if additional_filters is not None:
             query = query.where(additional_filters)
 
+        if options:
+            query = query.options(*options)
+        if order_by is not None:
+            if isinstance(order_by, (list, tuple)):
+                query = query.order_by(*order_by)
+            else:
+                query = query.order_by(order_by)
+
         # Pagination
         query = query.offset(skip).limit(limit)
 
@@ -196,22 +246,20 @@ class PermissionMixin:
             HTTPException(403): Permission denied
         """
         # Load resource
-        query = select(cls)
-
         if namespace is not None and name is not None:
             # Namespaced lookup
             if not cls._is_namespaced():
                 raise ValueError(f"{cls.__name__} is not namespaced")
-            query = query.where(cls.namespace == namespace, cls.name == name)
+            result = await db.execute(
+                cls._by_name_statement(), {"namespace": namespace, "name": name}
+            )
+            resource = result.scalar_one_or_none()
         elif resource_id is not None:
-            # ID lookup
-            query = query.where(cls.id == resource_id)
+            # ID lookup (identity map first, then a primary-key SELECT)
+            resource = await db.get(cls, resource_id)
         else:
             raise ValueError("Must provide either resource_id or namespace/name")
 
-        result = await db.execute(query)
-        resource = result.scalar_one_or_none()
-
         if not resource:
             raise HTTPException(404, f"{cls.__name__} not found")
 
@@ -252,39 +300,38 @@ class PermissionMixin:
         if check_permission(permissions, f"{perm_base}:all"):
             return True
 
-        # Check :own
-        if check_permission(permissions, f"{perm_base}:own"):
-            if self._has_ownership():
-                # Owner always has access
-                if str(self.user_id) == user_id:
-                    return True
-                # Non-owner: grant access if resource is non-private
-                if self._has_visibility() and getattr(self, "visibility", "private") != "private":
-                    return True
+        # Check :own. Decide ownership first (cheap attribute reads) so a
+        # non-owner of a private resource skips the second pattern scan.
+        if self._has_ownership():
+            # Owner always has access; non-owners only if the resource is non-private
+            is_owner = str(self.user_id) == user_id
+            if not is_owner and not (
+                self._has_visibility() and getattr(self, "visibility", "private") != "private"
+            ):
                 return False
-            else:
-                # No ownership field = anyone with :own can access
-                return True
 
-        return False
+        # No ownership field = anyone with :own can access
+        return check_permission(permissions, f"{perm_base}:own")
 
     @classmethod
-    def _get_accessible_namespaces(
+    def _get_accessible_scopes(
         cls,
         permissions: dict[str, bool],
         action: str,
-    ) -> set[str]:
+    ) -> tuple[set[str], set[tuple[str, str]]]:
         """
-        Extract accessible namespaces from user permissions.
+        Extract accessible namespaces and individual resources from user permissions.
 
         Args:
             permissions: User's permission dictionary
             action: Action being performed (e.g., "read", "execute", "update")
 
         Returns:
-            Set of namespace strings user can access for this specific action
+            (namespaces, resources): namespaces granted via "<ns>/*" patterns, and
+            (namespace, name) pairs granted individually via "<ns>/<name>"
         """
-        accessible = set()
+        namespaces = set()
+        resources = set()
 
         # Look for permissions matching this resource type
         # e.g., "sinas.functions/marketing/*.execute:all"
@@ -300,20 +347,23 @@ class PermissionMixin:
                 try:
                     # Remove scope suffix (:all/:own)
                     perm_without_scope = perm_key.split(":")[0]
-                    # Extract action (last part after final dot)
-                    perm_action = perm_without_scope.split(".")[-1]
+                    # Split off action (last part after final dot)
+                    path, perm_action = perm_without_scope[len(prefix) :].rsplit(".", 1)
 
                     # Only include if action matches OR is wildcard
                     if perm_action != action and perm_action != "*":
                         continue
 
-                    # Extract namespace
-                    after_prefix = perm_key[len(prefix) :]
-                    namespace_part = after_prefix.split("/")[0]
+                    # Extract namespace and (optional) name
+                    namespace_part, _, name_part = path.partition("/")
 
-                    if namespace_part != "*":
-                        accessible.add(namespace_part)
-                except:
+                    if namespace_part == "*":
+                        continue
+                    if name_part and name_part != "*":
+                        resources.add((namespace_part, name_part))
+                    else:
+                        namespaces.add(namespace_part)
+                except ValueError:
                     continue
 
-        return accessible
+        return namespaces, resources
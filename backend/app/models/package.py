@@ -37,3 +37,6 @@ class Package(Base):
 
     # Relationship
     installer: Mapped[Optional["User"]] = relationship("User", foreign_keys=[installed_by])
+
+    # Return installed_at/updated_at via RETURNING so install() needs no refresh
+    __mapper_args__ = {"eager_defaults": True}
@@ -5,7 +5,6 @@ from typing import Optional
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 from sqlalchemy.sql import func
 
 from app.models.base import Base
@@ -36,9 +35,11 @@ class Skill(Base, PermissionMixin):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     __table_args__ = (UniqueConstraint("namespace", "name", name="uq_skill_namespace_name"),)
+    # Fetch created_at/updated_at via RETURNING so writers can skip refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     @classmethod
     async def get_by_name(cls, db: AsyncSession, namespace: str, name: str) -> Optional["Skill"]:
         """Get skill by namespace and name."""
-        result = await db.execute(select(cls).where(cls.namespace == namespace, cls.name == name))
+        result = await db.execute(cls._by_name_statement(), {"namespace": namespace, "name": name})
         return result.scalar_one_or_none()
@@ -1,9 +1,10 @@
 """State store model for agent/function/workflow state management."""
 import uuid as uuid_lib
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, Optional
 
-from sqlalchemy import JSON, Boolean, Float, ForeignKey, Index, String, Text
+from sqlalchemy import JSON, Boolean, Float, ForeignKey, Index, String, Text, or_
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, created_at, updated_at, uuid_pk
@@ -40,7 +41,8 @@ class State(Base):
 
     # Metadata
     description: Mapped[Optional[str]] = mapped_column(Text)
-    tags: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
+    # jsonb so tag filters can use @> containment against the GIN index below
+    tags: Mapped[list[str]] = mapped_column(JSONB, default=list, nullable=False)
 
     # Ranking and lifecycle
     relevance_score: Mapped[float] = mapped_column(Float, default=1.0, nullable=False)
@@ -53,10 +55,32 @@ class State(Base):
     user: Mapped["User"] = relationship("User", back_populates="states")
     store: Mapped["Store"] = relationship("Store", back_populates="states")
 
+    @classmethod
+    def not_expired(cls, now: Optional[datetime] = None):
+        """SQL predicate for states with no expiry or one still in the future.
+
+        expires_at is a naive UTC column, so ``now`` defaults to naive UTC too.
+        """
+        if now is None:
+            now = datetime.now(UTC).replace(tzinfo=None)
+        return or_(cls.expires_at == None, cls.expires_at > now)  # noqa: E711
+
+    # Fetch server-generated created_at/updated_at via RETURNING on INSERT and
+    # UPDATE, so writers don't need a follow-up refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         # Unique constraint: one key per user/store combination
         Index("uq_state_user_store_key", "user_id", "store_id", "key", unique=True),
         # Performance indexes
         Index("ix_states_store_visibility", "store_id", "visibility"),
         Index("ix_states_expires_at", "expires_at"),
+        # Backs list_states' newest-first keyset pagination
+        Index("ix_states_store_created_at_id", "store_id", "created_at", "id"),
+        Index(
+            "ix_states_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
     )
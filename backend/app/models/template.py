@@ -1,7 +1,7 @@
 import uuid
 from typing import Any, Optional
 
-from sqlalchemy import JSON, Boolean, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import JSON, Boolean, ForeignKey, Index, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, created_at, updated_at, uuid_pk
@@ -10,7 +10,15 @@ from .mixins import PermissionMixin
 
 class Template(Base, PermissionMixin):
     __tablename__ = "templates"
-    __table_args__ = (UniqueConstraint("namespace", "name", name="uix_template_namespace_name"),)
+    __table_args__ = (
+        # Also serves as the (namespace, name) lookup index
+        UniqueConstraint("namespace", "name", name="uix_template_namespace_name"),
+        # Back list_templates' newest-first keyset pagination, unfiltered and per owner
+        Index("ix_templates_created_at_id", "created_at", "id"),
+        Index("ix_templates_user_created_at_id", "user_id", "created_at", "id"),
+    )
+    # Fetch created_at/updated_at via RETURNING so writers can skip refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid_pk]
     namespace: Mapped[str] = mapped_column(
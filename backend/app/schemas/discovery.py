@@ -0,0 +1,18 @@
+"""Runtime discovery schemas."""
+from pydantic import BaseModel
+
+from app.schemas.agent import AgentResponse
+from app.schemas.file import CollectionResponse
+from app.schemas.function import FunctionResponse
+from app.schemas.skill import SkillResponse
+from app.schemas.template import TemplateResponse
+
+
+class DiscoveryResponse(BaseModel):
+    """All resource types visible to the current user, in one payload."""
+
+    agents: list[AgentResponse] = []
+    functions: list[FunctionResponse] = []
+    skills: list[SkillResponse] = []
+    collections: list[CollectionResponse] = []
+    templates: list[TemplateResponse] = []
@@ -46,3 +46,9 @@ class SkillResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class SkillListResponse(SkillResponse):
+    """List item; content is None when the list is requested without content."""
+
+    content: Optional[str] = None
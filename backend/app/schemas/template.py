@@ -54,6 +54,13 @@ class TemplateResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TemplateListResponse(TemplateResponse):
+    """List item; content fields are None when the list is requested without content."""
+
+    html_content: Optional[str] = None
+    text_content: Optional[str] = None
+
+
 class TemplateRenderRequest(BaseModel):
     """Request to render a template with variables."""
 
@@ -0,0 +1,87 @@
+"""Commit-driven invalidation for short-lived in-process caches."""
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Redis is read at most this often per worker, so cache hits in between cost no
+# round-trip; it bounds how long another worker's invalidation can go unseen
+SHARED_REFRESH_SECONDS = 1.0
+
+
+class CacheGeneration:
+    """
+    Generation counter for an in-process cache, shared across workers via Redis.
+
+    Writers call invalidate_on_commit(db); once that transaction commits, the
+    local cache is cleared and the shared counter bumped so other workers stop
+    serving their entries. Readers tag entries with current(), read *before*
+    the DB lookup, and only serve entries whose tag still matches - so a row
+    loaded concurrently with a commit is never served afterwards. The shared
+    counter is re-read at most every SHARED_REFRESH_SECONDS.
+    """
+
+    def __init__(self, name: str, clear: Callable[[], None]):
+        self.redis_key = f"sinas:{name}:generation"
+        self._info_key = f"invalidate_{name}"
+        self._clear = clear
+        # Bumped on commit, so this worker never waits on Redis to see its own writes
+        self._local = 0
+        self._shared: Optional[str] = None
+        self._shared_read_at: Optional[float] = None
+        self._pending: set[asyncio.Task] = set()
+
+    def invalidate_on_commit(self, db: AsyncSession) -> None:
+        self.invalidate_session_on_commit(db.sync_session)
+
+    def invalidate_session_on_commit(self, session: Session) -> None:
+        """Same as invalidate_on_commit, for a sync Session (e.g. inside ORM events)."""
+        if session.info.get(self._info_key):
+            return
+        session.info[self._info_key] = True
+        event.listen(session, "after_commit", self._after_commit, once=True)
+
+    def _after_commit(self, session) -> None:
+        session.info.pop(self._info_key, None)
+        self._local += 1
+        self._clear()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Sync session outside the app's loop; other workers expire by TTL
+        task = loop.create_task(self._bump())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _bump(self) -> None:
+        try:
+            redis = await get_redis()
+            shared = await redis.incr(self.redis_key)
+        except Exception:
+            logger.warning(f"Failed to publish invalidation for {self.redis_key}", exc_info=True)
+            return
+        # Our own write shouldn't wait for the next refresh to show up here
+        self._shared = str(shared)
+        self._shared_read_at = time.monotonic()
+
+    async def current(self) -> Optional[tuple]:
+        """(local, shared) generation, or None if the shared one can't be read."""
+        now = time.monotonic()
+        if self._shared_read_at is None or now - self._shared_read_at >= SHARED_REFRESH_SECONDS:
+            try:
+                redis = await get_redis()
+                self._shared = await redis.get(self.redis_key)
+            except Exception:
+                logger.warning(f"{self.redis_key} unavailable, bypassing cache", exc_info=True)
+                return None
+            self._shared_read_at = now
+        return (self._local, self._shared)
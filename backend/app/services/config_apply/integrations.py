@@ -15,6 +15,7 @@ from app.models.template import Template
 from app.models.webhook import Webhook
 
 from app.services.config_apply.normalizers import should_skip_existing
+from app.services.webhook_cache import invalidate_webhook_cache_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +110,9 @@ async def apply_webhooks(
         except Exception as e:
             errors.append(f"Error applying webhook '{webhook_config.path}': {str(e)}")
 
+    if not dry_run:
+        invalidate_webhook_cache_on_commit(db)
+
 
 async def apply_templates(
     db: AsyncSession,
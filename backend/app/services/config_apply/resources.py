@@ -25,6 +25,7 @@ from app.models.skill import Skill
 from app.models.store import Store
 
 from app.services.config_apply.normalizers import normalize_store_references, should_skip_existing
+from app.services.manifest_cache import invalidate_manifest_cache_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -833,6 +834,7 @@ async def apply_manifests(
                     existing.is_active = True
                     existing.config_checksum = config_hash
                     existing.updated_at = datetime.utcnow()
+                    invalidate_manifest_cache_on_commit(db)
 
                 track_change("update", "manifests", resource_name)
 
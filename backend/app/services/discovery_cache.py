@@ -0,0 +1,55 @@
+"""Invalidation for the per-user discovery response cache."""
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+from app.models.agent import Agent
+from app.models.file import Collection
+from app.models.function import Function
+from app.models.manifest import Manifest
+from app.models.skill import Skill
+from app.models.template import Template
+from app.services.cache_generation import CacheGeneration
+
+# Listed resource types, plus manifests since they scope listings via ?app=
+_DISCOVERY_MODELS = (Agent, Function, Skill, Collection, Template, Manifest)
+
+# Responses live only in Redis, so there is no local cache to clear
+_generation = CacheGeneration("discovery", lambda: None)
+
+
+async def discovery_generation() -> Optional[str]:
+    """
+    Current discovery generation, for use in cache keys.
+
+    Bumped after any commit that writes a listed model, so cached responses
+    stop being served as soon as a resource changes. None if Redis is down.
+    """
+    generation = await _generation.current()
+    if generation is None:
+        return None
+    return generation[1] or "0"
+
+
+def _invalidate_on_flush(session: Session, flush_context) -> None:
+    if any(isinstance(obj, _DISCOVERY_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        _generation.invalidate_session_on_commit(session)
+
+
+def _invalidate_on_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk insert/update/delete statements (config apply, package uninstall,
+    # default templates) bypass the flush
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _DISCOVERY_MODELS):
+        _generation.invalidate_session_on_commit(orm_execute_state.session)
+
+
+# Caching is opt-in; with it off, flushes and commits shouldn't pay for tracking
+if settings.discovery_cache_ttl > 0:
+    event.listen(Session, "after_flush", _invalidate_on_flush)
+    event.listen(Session, "do_orm_execute", _invalidate_on_bulk_write)
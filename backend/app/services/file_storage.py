@@ -1,14 +1,18 @@
 """File storage abstraction layer."""
+import asyncio
 import base64
 import hashlib
+import logging
 import os
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from jose import jwt
 
+logger = logging.getLogger(__name__)
+
 
 class FileStorage(ABC):
     """Abstract base class for file storage backends."""
@@ -27,6 +31,24 @@ class FileStorage(ABC):
         """
         pass
 
+    async def save_stream(self, path: str, chunks: AsyncIterator[bytes]) -> str:
+        """
+        Save file data from an async iterator of chunks.
+
+        Backends that can write incrementally should override this; the
+        default buffers the chunks and delegates to save().
+
+        Args:
+            path: Relative path where file should be stored
+            chunks: File content as successive byte chunks
+
+        Returns:
+            SHA256 hash of the saved content as hex string
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save(path, data)
+        return self.calculate_hash(data)
+
     @abstractmethod
     async def read(self, path: str) -> bytes:
         """
@@ -50,6 +72,21 @@ class FileStorage(ABC):
         """
         pass
 
+    async def delete_many(self, paths: list[str]) -> None:
+        """
+        Delete several files from storage concurrently.
+
+        Backends with a native bulk delete should override this. Failures are
+        logged per path and don't abort the remaining deletes.
+
+        Args:
+            paths: Relative paths to delete
+        """
+        results = await asyncio.gather(*(self.delete(path) for path in paths), return_exceptions=True)
+        for path, result in zip(paths, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to delete {path} from storage: {result}")
+
     @abstractmethod
     async def exists(self, path: str) -> bool:
         """
@@ -143,6 +180,44 @@ class LocalFileStorage(FileStorage):
 
         return path
 
+    async def save_stream(self, path: str, chunks: AsyncIterator[bytes]) -> str:
+        """
+        Write chunks to the local filesystem, hashing as they are written.
+
+        All file I/O (and hashing) runs in worker threads, so a large upload
+        doesn't stall the event loop between chunks.
+        """
+        full_path = self._get_full_path(path)
+        temp_path = full_path.with_suffix(full_path.suffix + ".tmp")
+        digest = hashlib.sha256()
+
+        def _open():
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            return temp_path.open("wb")
+
+        def _write(f, chunk: bytes) -> None:
+            digest.update(chunk)
+            f.write(chunk)
+
+        def _finish(f) -> None:
+            f.close()
+            temp_path.rename(full_path)
+
+        def _discard(f) -> None:
+            f.close()
+            temp_path.unlink(missing_ok=True)
+
+        f = await asyncio.to_thread(_open)
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(_write, f, chunk)
+            await asyncio.to_thread(_finish, f)
+        except BaseException:
+            await asyncio.shield(asyncio.to_thread(_discard, f))
+            raise
+
+        return digest.hexdigest()
+
     async def read(self, path: str) -> bytes:
         """Read file data from local filesystem."""
         full_path = self._get_full_path(path)
@@ -159,6 +234,18 @@ class LocalFileStorage(FileStorage):
         if full_path.exists():
             full_path.unlink()
 
+    async def delete_many(self, paths: list[str]) -> None:
+        """Delete files from local filesystem in one worker-thread pass."""
+
+        def _unlink_all() -> None:
+            for path in paths:
+                try:
+                    self._get_full_path(path).unlink(missing_ok=True)
+                except Exception as e:
+                    logger.warning(f"Failed to delete {path} from storage: {e}")
+
+        await asyncio.to_thread(_unlink_all)
+
     async def exists(self, path: str) -> bool:
         """Check if file exists in local filesystem."""
         full_path = self._get_full_path(path)
@@ -0,0 +1,66 @@
+"""Short-lived cache for runtime manifest (app context) lookups."""
+import copy
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.manifest import Manifest
+from app.services.cache_generation import CacheGeneration
+
+# Manifest definitions change rarely; cache resolved (namespace, name) lookups
+# in-process for a short time so runtime requests don't each hit the DB.
+# Misses aren't cached.
+MANIFEST_CACHE_TTL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class ManifestContext:
+    """Detached snapshot of the Manifest fields runtime endpoints filter on."""
+
+    id: uuid.UUID
+    namespace: str
+    name: str
+    exposed_namespaces: dict[str, list[str]]
+
+    @classmethod
+    def from_model(cls, manifest: Manifest) -> "ManifestContext":
+        return cls(
+            id=manifest.id,
+            namespace=manifest.namespace,
+            name=manifest.name,
+            exposed_namespaces=copy.deepcopy(manifest.exposed_namespaces or {}),
+        )
+
+
+# (namespace, name) -> (expiry, generation at load time, snapshot)
+_manifest_cache: dict[tuple[str, str], tuple[float, tuple, ManifestContext]] = {}
+_generation = CacheGeneration("manifests", _manifest_cache.clear)
+
+
+def invalidate_manifest_cache_on_commit(db: AsyncSession) -> None:
+    """Invalidate cached manifests in every worker once db's transaction commits."""
+    _generation.invalidate_on_commit(db)
+
+
+async def get_manifest_cached(
+    db: AsyncSession, namespace: str, name: str
+) -> Optional[ManifestContext]:
+    """Manifest.get_by_name as a snapshot, served from a short TTL cache."""
+    key = (namespace, name)
+    generation = await _generation.current()
+
+    cached = _manifest_cache.get(key)
+    if cached and generation is not None and cached[0] > time.monotonic() and cached[1] == generation:
+        return cached[2]
+
+    manifest = await Manifest.get_by_name(db, namespace=namespace, name=name)
+    if not manifest:
+        return None
+
+    snapshot = ManifestContext.from_model(manifest)
+    if generation is not None:
+        _manifest_cache[key] = (time.monotonic() + MANIFEST_CACHE_TTL_SECONDS, generation, snapshot)
+    return snapshot
@@ -26,6 +26,7 @@ from app.schemas.config import ConfigApplyResponse, SinasConfig
 from app.services.config_apply import ConfigApplyService
 from app.services.config_export import ConfigExportService
 from app.services.config_parser import ConfigParser
+from app.services.manifest_cache import invalidate_manifest_cache_on_commit
 from app.services.resource_serializers import (
     _remove_none_values,
     serialize_agent,
@@ -42,6 +43,7 @@ from app.services.resource_serializers import (
     serialize_template,
     serialize_webhook,
 )
+from app.services.webhook_cache import invalidate_webhook_cache_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -143,9 +145,10 @@ class PackageService:
             )
             self.db.add(package)
 
-        # Single commit for everything
+        # Single commit for everything. Server-side timestamps come back via
+        # RETURNING (eager_defaults) and the session doesn't expire on commit,
+        # so the package is ready to serialize without a refresh SELECT
         await self.db.commit()
-        await self.db.refresh(package)
 
         return package, result
 
@@ -191,12 +194,13 @@ class PackageService:
         """
         managed_by = f"pkg:{package_name}"
 
-        # Check package exists
+        # Delete the package record first; RETURNING doubles as the existence
+        # check, so the (wide) source_yaml row is never loaded. Nothing else has
+        # been touched yet if it turns out not to be installed.
         result = await self.db.execute(
-            select(Package).where(Package.name == package_name)
+            delete(Package).where(Package.name == package_name).returning(Package.id)
         )
-        package = result.scalar_one_or_none()
-        if not package:
+        if result.scalar_one_or_none() is None:
             raise ValueError(f"Package '{package_name}' is not installed")
 
         deleted_counts = {}
@@ -224,17 +228,21 @@ class PackageService:
             if result.rowcount > 0:
                 deleted_counts[type_name] = result.rowcount
 
-        # Delete package record
-        await self.db.delete(package)
+        if "manifests" in deleted_counts:
+            invalidate_manifest_cache_on_commit(self.db)
+        if "webhooks" in deleted_counts:
+            invalidate_webhook_cache_on_commit(self.db)
+
         await self.db.commit()
 
         return deleted_counts
 
-    async def list_packages(self) -> list[Package]:
-        """List all installed packages."""
-        result = await self.db.execute(
-            select(Package).order_by(Package.installed_at.desc())
-        )
+    async def list_packages(self, skip: int = 0, limit: Optional[int] = None) -> list[Package]:
+        """List installed packages, newest first."""
+        query = select(Package).order_by(Package.installed_at.desc()).offset(skip)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
     async def get_package(self, name: str) -> Optional[Package]:
@@ -368,11 +376,9 @@ class PackageService:
         provider_name = None
         if agent.llm_provider_id:
             result = await self.db.execute(
-                select(LLMProvider).where(LLMProvider.id == agent.llm_provider_id)
+                select(LLMProvider.name).where(LLMProvider.id == agent.llm_provider_id)
             )
-            provider = result.scalar_one_or_none()
-            if provider:
-                provider_name = provider.name
+            provider_name = result.scalar_one_or_none()
         return serialize_agent(agent, provider_name)
 
     async def _export_function(self, func: Function) -> dict:
@@ -392,11 +398,11 @@ class PackageService:
         conn_name = None
         if query.database_connection_id:
             result = await self.db.execute(
-                select(DatabaseConnection).where(DatabaseConnection.id == query.database_connection_id)
+                select(DatabaseConnection.name).where(
+                    DatabaseConnection.id == query.database_connection_id
+                )
             )
-            conn = result.scalar_one_or_none()
-            if conn:
-                conn_name = conn.name
+            conn_name = result.scalar_one_or_none()
         return serialize_query(query, conn_name)
 
     async def _export_collection(self, collection: Collection) -> dict:
@@ -419,13 +425,11 @@ class PackageService:
         conn_name = None
         if trigger.database_connection_id:
             result = await self.db.execute(
-                select(DatabaseConnection).where(
+                select(DatabaseConnection.name).where(
                     DatabaseConnection.id == trigger.database_connection_id
                 )
             )
-            conn = result.scalar_one_or_none()
-            if conn:
-                conn_name = conn.name
+            conn_name = result.scalar_one_or_none()
         return serialize_database_trigger(trigger, conn_name)
 
     async def _export_connector(self, conn: Connector) -> dict:
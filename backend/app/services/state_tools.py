@@ -1,7 +1,6 @@
 """State store tools for LLM to save/retrieve state within stores."""
 import json
 import uuid as uuid_lib
-from datetime import datetime
 from typing import Any, Optional
 
 import jsonschema
@@ -298,7 +297,7 @@ class StateTools:
             .where(
                 and_(
                     State.store_id.in_(store_ids.keys()),
-                    or_(State.expires_at == None, State.expires_at > datetime.utcnow()),
+                    State.not_expired(),
                     visibility_filter,
                 )
             )
@@ -436,7 +435,7 @@ class StateTools:
         # Base filter: user's own + shared, not expired, in allowed stores
         base_filter = and_(
             State.store_id.in_(store_ids.keys()),
-            or_(State.expires_at == None, State.expires_at > datetime.utcnow()),
+            State.not_expired(),
             or_(
                 State.user_id == user_uuid,
                 and_(State.visibility == "shared", State.store_id.in_(store_ids.keys())),
@@ -499,7 +498,7 @@ class StateTools:
         # Tag filter: all specified tags must be present
         if tag_filter:
             for tag in tag_filter:
-                query = query.where(State.tags.op("@>")(json.dumps([tag])))
+                query = query.where(State.tags.contains([tag]))
 
         # Search filter
         if search:
@@ -662,7 +661,7 @@ class StateTools:
 
         query = select(State).where(
             and_(
-                or_(State.expires_at == None, State.expires_at > datetime.utcnow()),
+                State.not_expired(),
                 visibility_filter,
             )
         )
@@ -841,7 +840,7 @@ class StateTools:
         query = select(State).options(selectinload(State.store)).where(
             and_(
                 State.store_id.in_(store_ids),
-                or_(State.expires_at == None, State.expires_at > datetime.utcnow()),
+                State.not_expired(),
                 visibility_filter,
             )
         )
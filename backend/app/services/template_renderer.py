@@ -6,6 +6,7 @@ Used for:
 
 Security: Uses sandboxed Jinja2 environment with autoescape enabled.
 """
+from functools import lru_cache
 from typing import Any, Optional
 
 from jinja2 import Environment, StrictUndefined, select_autoescape
@@ -19,6 +20,17 @@ _jinja_env = Environment(
 )
 
 
+@lru_cache(maxsize=512)
+def _compile(template_str: str):
+    """Compile a template string once; the source itself is the cache key.
+
+    Environment.from_string bypasses Jinja's own template cache, so without
+    this every render re-parses and re-compiles the same prompt/template
+    source. Edited sources simply miss and get compiled fresh.
+    """
+    return _jinja_env.from_string(template_str)
+
+
 def render_template(template_str: str, context: dict[str, Any]) -> str:
     """
     Render a Jinja2 template with given context.
@@ -33,8 +45,7 @@ def render_template(template_str: str, context: dict[str, Any]) -> str:
     Raises:
         jinja2.exceptions.TemplateError: If template is invalid or missing variables
     """
-    template = _jinja_env.from_string(template_str)
-    return template.render(**context)
+    return _compile(template_str).render(**context)
 
 
 def render_function_parameters(
@@ -87,7 +98,7 @@ def validate_template(template_str: str) -> Optional[str]:
         None if valid, error message if invalid
     """
     try:
-        _jinja_env.from_string(template_str)
+        _compile(template_str)
         return None
     except Exception as e:
         return f"Invalid template syntax: {str(e)}"
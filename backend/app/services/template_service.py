@@ -1,5 +1,6 @@
 """Template rendering service with Jinja2 and schema validation."""
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
 import jsonschema
@@ -8,6 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.template import Template
+from app.utils.schema import validate_cached
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,8 @@ class TemplateService:
             autoescape=True,  # Protects variables: {{user_email}} is escaped
             undefined=StrictUndefined,  # Raise errors on undefined variables
         )
+        # from_string skips Jinja's own cache; memoize compiled templates by source
+        self._compile = lru_cache(maxsize=512)(self.jinja_env.from_string)
 
     def validate_variables(self, variables: dict[str, Any], schema: dict[str, Any]) -> None:
         """
@@ -39,7 +43,7 @@ class TemplateService:
         if not schema:
             return  # No schema = no validation
 
-        jsonschema.validate(variables, schema)
+        validate_cached(variables, schema)
 
     async def render_template(
         self,
@@ -94,7 +98,7 @@ class TemplateService:
         rendered_title = None
         if template.title:
             try:
-                title_template = self.jinja_env.from_string(template.title)
+                title_template = self._compile(template.title)
                 rendered_title = title_template.render(**variables)
             except TemplateError as e:
                 logger.error(f"Template title rendering failed for {template_name}: {e}")
@@ -102,7 +106,7 @@ class TemplateService:
 
         # Render HTML content
         try:
-            html_template = self.jinja_env.from_string(template.html_content)
+            html_template = self._compile(template.html_content)
             rendered_html = html_template.render(**variables)
         except TemplateError as e:
             logger.error(f"Template HTML rendering failed for {template_name}: {e}")
@@ -112,7 +116,7 @@ class TemplateService:
         rendered_text = None
         if template.text_content:
             try:
-                text_template = self.jinja_env.from_string(template.text_content)
+                text_template = self._compile(template.text_content)
                 rendered_text = text_template.render(**variables)
             except TemplateError as e:
                 logger.error(f"Template text rendering failed for {template_name}: {e}")
@@ -154,17 +158,17 @@ class TemplateService:
         # Render title (if present)
         rendered_title = None
         if title:
-            title_template = self.jinja_env.from_string(title)
+            title_template = self._compile(title)
             rendered_title = title_template.render(**variables)
 
         # Render HTML content
-        html_template = self.jinja_env.from_string(html_content)
+        html_template = self._compile(html_content)
         rendered_html = html_template.render(**variables)
 
         # Render text content (if present)
         rendered_text = None
         if text_content:
-            text_template = self.jinja_env.from_string(text_content)
+            text_template = self._compile(text_content)
             rendered_text = text_template.render(**variables)
 
         return rendered_title, rendered_html, rendered_text
@@ -0,0 +1,111 @@
+"""Short-lived cache for runtime webhook lookups."""
+import copy
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import and_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.webhook import Webhook
+from app.services.cache_generation import CacheGeneration
+
+logger = logging.getLogger(__name__)
+
+# Webhook definitions change rarely but are looked up on every inbound call;
+# cache (path, method) lookups in-process for a short time. Misses aren't
+# cached, and an expired entry is kept around as a fallback if the DB errors.
+WEBHOOK_CACHE_TTL_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class ActiveWebhook:
+    """
+    Detached snapshot of the Webhook fields the runtime handler reads.
+
+    Safe to share across requests, unlike the ORM instance, which is bound to
+    (and expires with) the session that loaded it.
+    """
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    path: str
+    function_namespace: str
+    function_name: str
+    requires_auth: bool
+    response_mode: str
+    default_values: Optional[dict[str, Any]]
+    dedup: Optional[dict[str, Any]]
+
+    @classmethod
+    def from_model(cls, webhook: Webhook) -> "ActiveWebhook":
+        return cls(
+            id=webhook.id,
+            user_id=webhook.user_id,
+            path=webhook.path,
+            function_namespace=webhook.function_namespace,
+            function_name=webhook.function_name,
+            requires_auth=webhook.requires_auth,
+            response_mode=webhook.response_mode,
+            default_values=copy.deepcopy(webhook.default_values),
+            dedup=copy.deepcopy(webhook.dedup),
+        )
+
+
+# (path, method) -> (expiry, generation at load time, snapshot)
+_webhook_cache: dict[tuple[str, str], tuple[float, tuple, ActiveWebhook]] = {}
+_generation = CacheGeneration("webhooks", _webhook_cache.clear)
+
+
+def invalidate_webhook_cache_on_commit(db: AsyncSession) -> None:
+    """
+    Invalidate cached lookups in every worker once db's transaction commits.
+
+    Call this wherever webhooks are created, updated or deleted. Invalidating
+    before the commit would let a concurrent lookup re-cache the old row.
+    """
+    _generation.invalidate_on_commit(db)
+
+
+async def get_active_webhook(
+    db: AsyncSession, path: str, method: str
+) -> Optional[ActiveWebhook]:
+    """Active webhook for (path, method), served from a short TTL cache."""
+    key = (path, method)
+    now = time.monotonic()
+
+    generation = await _generation.current()
+
+    cached = _webhook_cache.get(key)
+    if cached and generation is not None and cached[0] > now and cached[1] == generation:
+        return cached[2]
+
+    try:
+        result = await db.execute(
+            select(Webhook).where(
+                and_(
+                    Webhook.path == path,
+                    Webhook.http_method == method,
+                    Webhook.is_active == True,
+                )
+            )
+        )
+    except SQLAlchemyError:
+        if not cached:
+            raise
+        logger.warning(f"Webhook lookup failed, serving cached '{method} {path}'", exc_info=True)
+        await db.rollback()
+        return cached[2]
+
+    webhook = result.scalar_one_or_none()
+    if not webhook:
+        _webhook_cache.pop(key, None)
+        return None
+
+    snapshot = ActiveWebhook.from_model(webhook)
+    if generation is not None:
+        _webhook_cache[key] = (now + WEBHOOK_CACHE_TTL_SECONDS, generation, snapshot)
+    return snapshot
@@ -0,0 +1,21 @@
+"""Opaque keyset-pagination cursors over (created_at, id)."""
+import base64
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Cursor pointing just past the row with this (created_at, id)."""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of encode_cursor; raises 400 for anything it didn't produce."""
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
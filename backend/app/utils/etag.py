@@ -0,0 +1,29 @@
+"""ETag helpers for conditional GETs on single resources."""
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def resource_etag(resource_id: Any, modified_at: Optional[datetime]) -> str:
+    """Weak ETag for a row, derived from its id and last-modified timestamp."""
+    stamp = modified_at.isoformat() if modified_at else ""
+    digest = hashlib.sha256(f"{resource_id}:{stamp}".encode()).hexdigest()[:16]
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Return a 304 response if the client's If-None-Match already holds etag.
+
+    Callers still run their permission checks first, so a cached copy is only
+    confirmed to users who may read the resource.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if "*" in tags or etag in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
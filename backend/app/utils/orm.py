@@ -0,0 +1,24 @@
+"""Helpers for converting ORM rows into response schemas."""
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def from_orm_fast(model_cls: type[ModelT], obj: Any, **overrides: Any) -> ModelT:
+    """
+    Build a response model from a trusted ORM object without validation.
+
+    Equivalent to model_cls.model_validate(obj) for schemas that have no
+    "before" validators: values are copied as-is via model_construct, fields
+    missing on the object fall back to their defaults, and keyword overrides
+    take precedence. Use only for data that was validated on write.
+    """
+    values = {
+        name: getattr(obj, name)
+        for name in model_cls.model_fields
+        if name not in overrides and hasattr(obj, name)
+    }
+    values.update(overrides)
+    return model_cls.model_construct(**values)
@@ -1,5 +1,6 @@
 """JSON Schema utilities for validation and type coercion."""
 import json
+from functools import lru_cache
 from typing import Any
 
 import jsonschema
@@ -92,3 +93,28 @@ def validate_with_coercion(data: Any, schema: dict[str, Any]) -> Any:
     coerced_data = coerce_types(data, schema)
     jsonschema.validate(coerced_data, schema)
     return coerced_data
+
+
+@lru_cache(maxsize=256)
+def _validator_for(schema_json: str):
+    schema = json.loads(schema_json)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def validate_cached(instance: Any, schema: dict[str, Any]) -> None:
+    """
+    Same as jsonschema.validate, but reuses the checked validator per schema.
+
+    jsonschema.validate re-checks the schema against its metaschema and builds a
+    new validator on every call; here that happens once per distinct schema.
+
+    Raises:
+        jsonschema.ValidationError: If validation fails
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    validator = _validator_for(json.dumps(schema, sort_keys=True))
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
@@ -9,7 +9,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import (
     create_access_token,
-    create_otp_session,
     create_refresh_token,
     verify_otp_code,
 )
@@ -24,18 +23,17 @@ from tests.conftest import auth_headers, make_token
 
 
 async def test_login_existing_user(client: AsyncClient, test_user: User):
-    """POST /auth/login creates an OTP session for an existing user."""
-    with patch("app.api.runtime.endpoints.authentication.create_otp_session") as mock_create:
-        fake_session = AsyncMock()
-        fake_session.id = uuid.uuid4()
-        mock_create.return_value = fake_session
-
+    """POST /auth/login creates an OTP session and sends the email in the background."""
+    with patch(
+        "app.api.runtime.endpoints.authentication.send_otp_email", new_callable=AsyncMock
+    ) as mock_send:
         resp = await client.post("/auth/login", json={"email": test_user.email})
 
     assert resp.status_code == 200
     data = resp.json()
     assert data["message"] == "OTP sent to your email"
     assert "session_id" in data
+    mock_send.assert_awaited_once_with(uuid.UUID(data["session_id"]), test_user.email)
 
 
 async def test_login_nonexistent_user(client: AsyncClient):
@@ -225,12 +223,8 @@ async def test_login_rate_limit(client: AsyncClient, test_user: User):
     async for key in redis.scan_iter("sinas:ratelimit:login:*"):
         await redis.delete(key)
 
-    # Patch create_otp_session to avoid email sending
-    with patch("app.api.runtime.endpoints.authentication.create_otp_session") as mock_create:
-        fake_session = AsyncMock()
-        fake_session.id = uuid.uuid4()
-        mock_create.return_value = fake_session
-
+    # Patch send_otp_email to avoid email sending
+    with patch("app.api.runtime.endpoints.authentication.send_otp_email", new_callable=AsyncMock):
         # Exceed the per-email rate limit (5 by default)
         for i in range(settings.rate_limit_login_email_max + 1):
             resp = await client.post("/auth/login", json={"email": test_user.email})
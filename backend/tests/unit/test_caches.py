@@ -0,0 +1,220 @@
+"""Tests for the in-process runtime lookup caches (webhooks, manifests)."""
+import time
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.webhook import HTTPMethod, Webhook
+from app.services import manifest_cache, webhook_cache
+from app.services.manifest_cache import get_manifest_cached
+from app.services.webhook_cache import get_active_webhook, invalidate_webhook_cache_on_commit
+from tests.conftest import auth_headers
+
+
+# ---------------------------------------------------------------------------
+# Helpers / fixtures
+# ---------------------------------------------------------------------------
+
+
+class FakeRedis:
+    """Just the generation counter calls CacheGeneration makes, counting GETs."""
+
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+@pytest_asyncio.fixture
+async def redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+
+    async def _get_redis():
+        return fake
+
+    monkeypatch.setattr("app.services.cache_generation.get_redis", _get_redis)
+    # Start every test with empty caches and no remembered shared generation
+    for generation in (webhook_cache._generation, manifest_cache._generation):
+        monkeypatch.setattr(generation, "_shared_read_at", None)
+    webhook_cache._webhook_cache.clear()
+    manifest_cache._manifest_cache.clear()
+    yield fake
+    webhook_cache._webhook_cache.clear()
+    manifest_cache._manifest_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def webhook(db: AsyncSession, admin_user) -> Webhook:
+    hook = Webhook(
+        user_id=admin_user.id,
+        path=f"cache-{uuid.uuid4().hex[:8]}",
+        function_namespace="default",
+        function_name="original",
+        http_method=HTTPMethod.POST,
+    )
+    db.add(hook)
+    await db.flush()
+    return hook
+
+
+class QueryCounter:
+    """Wraps db.execute to count the statements a lookup runs."""
+
+    def __init__(self, db: AsyncSession, monkeypatch):
+        self.count = 0
+        execute = db.execute
+
+        async def _execute(*args, **kwargs):
+            self.count += 1
+            return await execute(*args, **kwargs)
+
+        monkeypatch.setattr(db, "execute", _execute)
+
+
+def _advance_clock(monkeypatch, seconds: float) -> None:
+    real_monotonic = time.monotonic
+    monkeypatch.setattr(time, "monotonic", lambda: real_monotonic() + seconds)
+
+
+async def _rename_function(db: AsyncSession, hook: Webhook, function_name: str) -> None:
+    # Core UPDATE, so nothing but the cache itself decides what is served
+    await db.execute(update(Webhook).where(Webhook.id == hook.id).values(function_name=function_name))
+
+
+# =========================================================================
+# Webhook cache
+# =========================================================================
+
+
+class TestWebhookCache:
+    async def test_hit_skips_db_and_redis(self, db, redis, webhook, monkeypatch):
+        first = await get_active_webhook(db, webhook.path, "POST")
+        assert first.function_name == "original"
+        gets = redis.gets
+
+        queries = QueryCounter(db, monkeypatch)
+        second = await get_active_webhook(db, webhook.path, "POST")
+        assert second is first
+        assert queries.count == 0
+        assert redis.gets == gets
+
+    async def test_miss_is_not_cached(self, db, redis):
+        assert await get_active_webhook(db, "no-such-hook", "POST") is None
+        assert ("no-such-hook", "POST") not in webhook_cache._webhook_cache
+
+    async def test_expired_entry_is_reloaded(self, db, redis, webhook, monkeypatch):
+        await get_active_webhook(db, webhook.path, "POST")
+        await _rename_function(db, webhook, "renamed")
+
+        _advance_clock(monkeypatch, webhook_cache.WEBHOOK_CACHE_TTL_SECONDS + 1)
+
+        reloaded = await get_active_webhook(db, webhook.path, "POST")
+        assert reloaded.function_name == "renamed"
+
+    async def test_commit_invalidates_entry(self, db, redis, webhook):
+        await get_active_webhook(db, webhook.path, "POST")
+        await _rename_function(db, webhook, "renamed")
+
+        # Invalidation only takes effect once the writing transaction commits
+        invalidate_webhook_cache_on_commit(db)
+        cached = await get_active_webhook(db, webhook.path, "POST")
+        assert cached.function_name == "original"
+
+        await db.commit()
+        assert webhook_cache._webhook_cache == {}
+        reloaded = await get_active_webhook(db, webhook.path, "POST")
+        assert reloaded.function_name == "renamed"
+
+    async def test_commit_bumps_shared_generation(self, db, redis, webhook):
+        invalidate_webhook_cache_on_commit(db)
+        await db.commit()
+        for task in list(webhook_cache._generation._pending):
+            await task
+        assert redis.values[webhook_cache._generation.redis_key] == 1
+
+    async def test_db_error_serves_expired_entry(self, db, redis, webhook, monkeypatch):
+        cached = await get_active_webhook(db, webhook.path, "POST")
+
+        _advance_clock(monkeypatch, webhook_cache.WEBHOOK_CACHE_TTL_SECONDS + 1)
+
+        async def _failing_execute(*args, **kwargs):
+            raise OperationalError("SELECT", {}, Exception("connection refused"))
+
+        rollbacks = []
+
+        async def _rollback():
+            rollbacks.append(True)
+
+        monkeypatch.setattr(db, "execute", _failing_execute)
+        monkeypatch.setattr(db, "rollback", _rollback)
+
+        assert await get_active_webhook(db, webhook.path, "POST") is cached
+        assert rollbacks == [True]
+
+    async def test_db_error_without_entry_raises(self, db, redis, monkeypatch):
+        async def _failing_execute(*args, **kwargs):
+            raise OperationalError("SELECT", {}, Exception("connection refused"))
+
+        monkeypatch.setattr(db, "execute", _failing_execute)
+
+        with pytest.raises(OperationalError):
+            await get_active_webhook(db, "no-such-hook", "POST")
+
+
+# =========================================================================
+# Manifest cache
+# =========================================================================
+
+MANIFEST_PAYLOAD = {
+    "namespace": "test",
+    "name": "cached-app",
+    "exposed_namespaces": {"agents": ["default"]},
+}
+
+
+class TestManifestCache:
+    async def test_hit_skips_db_and_redis(self, client, db, redis, admin_user, monkeypatch):
+        resp = await client.post(
+            "/api/v1/manifests", json=MANIFEST_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        assert resp.status_code == 201
+
+        first = await get_manifest_cached(db, "test", "cached-app")
+        gets = redis.gets
+
+        queries = QueryCounter(db, monkeypatch)
+        assert await get_manifest_cached(db, "test", "cached-app") is first
+        assert queries.count == 0
+        assert redis.gets == gets
+
+    async def test_update_invalidates_entry(self, client, db, redis, admin_user):
+        await client.post(
+            "/api/v1/manifests", json=MANIFEST_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        cached = await get_manifest_cached(db, "test", "cached-app")
+        assert cached.exposed_namespaces == {"agents": ["default"]}
+
+        resp = await client.put(
+            "/api/v1/manifests/test/cached-app",
+            json={"exposed_namespaces": {"agents": ["support"]}},
+            headers=auth_headers(admin_user),
+        )
+        assert resp.status_code == 200
+
+        # get_db commits after the handler; the test session is only flushed
+        await db.commit()
+        assert manifest_cache._manifest_cache == {}
+        updated = await get_manifest_cached(db, "test", "cached-app")
+        assert updated.exposed_namespaces == {"agents": ["support"]}
@@ -1,10 +1,14 @@
-"""CRUD tests for core SINAS resources: Functions, Agents, Queries."""
+"""CRUD tests for core SINAS resources: Functions, Agents, Queries, Skills, Templates."""
 import uuid
+from datetime import datetime, timezone
 
 import pytest_asyncio
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.database_connection import DatabaseConnection
+from app.models.skill import Skill
+from app.models.template import Template
 from tests.conftest import auth_headers
 
 
@@ -361,3 +365,171 @@ class TestQueriesCRUD:
     async def test_unauthenticated_request_rejected(self, client):
         resp = await client.get("/api/v1/queries")
         assert resp.status_code in (401, 403)
+
+
+# =========================================================================
+# Skills / Templates uniqueness
+# =========================================================================
+
+SKILL_PAYLOAD = {
+    "namespace": "test",
+    "name": "summarize",
+    "description": "test skill",
+    "content": "Summarize the input.",
+}
+
+TEMPLATE_PAYLOAD = {
+    "namespace": "test",
+    "name": "welcome-email",
+    "html_content": "<p>Hello {{ name }}</p>",
+}
+
+
+class TestSkillsUniqueness:
+    """Namespace/name conflicts on /api/v1/skills."""
+
+    async def test_duplicate_skill_returns_400(self, client, admin_user):
+        await client.post("/api/v1/skills", json=SKILL_PAYLOAD, headers=auth_headers(admin_user))
+        resp = await client.post(
+            "/api/v1/skills", json=SKILL_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        assert resp.status_code == 400
+        assert "already exists" in resp.json()["detail"]
+
+    async def test_rename_into_existing_skill_returns_400(self, client, admin_user):
+        await client.post("/api/v1/skills", json=SKILL_PAYLOAD, headers=auth_headers(admin_user))
+        await client.post(
+            "/api/v1/skills",
+            json={**SKILL_PAYLOAD, "name": "translate"},
+            headers=auth_headers(admin_user),
+        )
+        resp = await client.put(
+            "/api/v1/skills/test/translate",
+            json={"name": "summarize"},
+            headers=auth_headers(admin_user),
+        )
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Skill 'test/summarize' already exists"
+
+
+class TestTemplatesUniqueness:
+    """Namespace/name conflicts on /api/v1/templates."""
+
+    async def test_duplicate_template_returns_400(self, client, admin_user):
+        await client.post(
+            "/api/v1/templates", json=TEMPLATE_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        resp = await client.post(
+            "/api/v1/templates", json=TEMPLATE_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        assert resp.status_code == 400
+        assert "already exists" in resp.json()["detail"]
+
+    async def test_rename_into_existing_template_returns_400(self, client, admin_user):
+        await client.post(
+            "/api/v1/templates", json=TEMPLATE_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        other = await client.post(
+            "/api/v1/templates",
+            json={**TEMPLATE_PAYLOAD, "name": "goodbye-email"},
+            headers=auth_headers(admin_user),
+        )
+        assert other.status_code == 201
+
+        resp = await client.patch(
+            f"/api/v1/templates/{other.json()['id']}",
+            json={"name": "welcome-email"},
+            headers=auth_headers(admin_user),
+        )
+        assert resp.status_code == 400
+        assert "already exists" in resp.json()["detail"]
+
+
+# =========================================================================
+# Conditional GETs (ETag / If-None-Match)
+# =========================================================================
+
+# Everything in a test shares one transaction, so now() never moves; backdate
+# rows to make the next write observable
+EARLIER = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestConditionalGet:
+    """ETag handling on single-resource GETs."""
+
+    async def test_skill_if_none_match_returns_304(self, client, admin_user):
+        await client.post("/api/v1/skills", json=SKILL_PAYLOAD, headers=auth_headers(admin_user))
+        resp = await client.get("/api/v1/skills/test/summarize", headers=auth_headers(admin_user))
+        assert resp.status_code == 200
+        etag = resp.headers["ETag"]
+
+        resp = await client.get(
+            "/api/v1/skills/test/summarize",
+            headers={**auth_headers(admin_user), "If-None-Match": etag},
+        )
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        assert resp.content == b""
+
+        resp = await client.get(
+            "/api/v1/skills/test/summarize",
+            headers={**auth_headers(admin_user), "If-None-Match": 'W/"stale"'},
+        )
+        assert resp.status_code == 200
+
+    async def test_skill_update_changes_etag(self, client, db, admin_user):
+        await client.post("/api/v1/skills", json=SKILL_PAYLOAD, headers=auth_headers(admin_user))
+        await db.execute(
+            update(Skill)
+            .where(Skill.namespace == "test", Skill.name == "summarize")
+            .values(updated_at=EARLIER)
+        )
+        before = await client.get(
+            "/api/v1/skills/test/summarize", headers=auth_headers(admin_user)
+        )
+
+        await client.put(
+            "/api/v1/skills/test/summarize",
+            json={"description": "updated skill"},
+            headers=auth_headers(admin_user),
+        )
+        resp = await client.get(
+            "/api/v1/skills/test/summarize",
+            headers={**auth_headers(admin_user), "If-None-Match": before.headers["ETag"]},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != before.headers["ETag"]
+        assert resp.json()["description"] == "updated skill"
+
+    async def test_template_if_none_match_returns_304(self, client, admin_user):
+        created = await client.post(
+            "/api/v1/templates", json=TEMPLATE_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        url = f"/api/v1/templates/{created.json()['id']}"
+        etag = (await client.get(url, headers=auth_headers(admin_user))).headers["ETag"]
+
+        resp = await client.get(
+            url, headers={**auth_headers(admin_user), "If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+
+    async def test_template_update_changes_etag(self, client, db, admin_user):
+        created = await client.post(
+            "/api/v1/templates", json=TEMPLATE_PAYLOAD, headers=auth_headers(admin_user)
+        )
+        template_id = created.json()["id"]
+        await db.execute(
+            update(Template).where(Template.id == uuid.UUID(template_id)).values(updated_at=EARLIER)
+        )
+        url = f"/api/v1/templates/{template_id}"
+        before = await client.get(url, headers=auth_headers(admin_user))
+
+        await client.patch(
+            url, json={"html_content": "<p>Hi {{ name }}</p>"}, headers=auth_headers(admin_user)
+        )
+        resp = await client.get(
+            url, headers={**auth_headers(admin_user), "If-None-Match": before.headers["ETag"]}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != before.headers["ETag"]
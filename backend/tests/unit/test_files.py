@@ -0,0 +1,198 @@
+"""Tests for file uploads (streamed multipart) and deletion under /files."""
+import base64
+import hashlib
+import uuid
+
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.file import Collection, ContentFilterEvaluation, File, FileVersion
+from app.models.function import Function
+from app.services.file_storage import LocalFileStorage
+from tests.conftest import auth_headers
+
+
+# ---------------------------------------------------------------------------
+# Helpers / fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest_asyncio.fixture
+async def storage(tmp_path, monkeypatch) -> LocalFileStorage:
+    """Local storage in a temp dir, used by the file endpoints."""
+    local = LocalFileStorage(base_path=str(tmp_path))
+    monkeypatch.setattr("app.api.runtime.endpoints.files.get_storage", lambda: local)
+    return local
+
+
+@pytest_asyncio.fixture
+async def collection(db: AsyncSession, admin_user) -> Collection:
+    """A fresh collection with a 1MB file size limit."""
+    coll = Collection(
+        namespace="test",
+        name=f"stream-{uuid.uuid4().hex[:8]}",
+        user_id=admin_user.id,
+        max_file_size_mb=1,
+    )
+    db.add(coll)
+    await db.flush()
+    return coll
+
+
+async def _upload(
+    client, user, coll: Collection, content: bytes, name: str = "data.bin", **form: str
+):
+    return await client.post(
+        f"/files/{coll.namespace}/{coll.name}/stream",
+        files={"file": (name, content, "application/octet-stream")},
+        data={"visibility": "private", **form},
+        headers=auth_headers(user),
+    )
+
+
+async def _current_version(db: AsyncSession, file_id: str) -> FileVersion:
+    result = await db.execute(select(FileVersion).where(FileVersion.file_id == uuid.UUID(file_id)))
+    return result.scalar_one()
+
+
+# =========================================================================
+# Streamed uploads
+# =========================================================================
+
+
+class TestStreamUpload:
+    async def test_stream_upload_stores_content_and_hash(
+        self, client, db, admin_user, collection, storage
+    ):
+        content = bytes(range(256)) * 4096  # exactly the 1MB limit
+        resp = await _upload(client, admin_user, collection, content)
+        assert resp.status_code == 201
+        body = resp.json()
+        assert body["name"] == "data.bin"
+
+        version = await _current_version(db, body["id"])
+        assert version.size_bytes == len(content)
+        assert version.hash_sha256 == hashlib.sha256(content).hexdigest()
+        assert await storage.read(version.storage_path) == content
+
+    async def test_stream_upload_over_size_limit_rejected(
+        self, client, admin_user, collection, storage
+    ):
+        content = b"x" * (1024 * 1024 + 1)
+        resp = await _upload(client, admin_user, collection, content)
+        assert resp.status_code == 413
+        assert "exceeds collection limit" in resp.json()["detail"]
+
+    async def test_content_filter_falls_back_to_buffered_upload(
+        self, client, db, admin_user, collection, storage, monkeypatch
+    ):
+        """Filtered collections buffer the stream and hand the filter base64 content."""
+        db.add(
+            Function(
+                user_id=admin_user.id,
+                namespace="test",
+                name="stream-filter",
+                code="def handler(input, context):\n    return {'approved': True}",
+                input_schema={},
+                output_schema={},
+            )
+        )
+        collection.content_filter_function = "test/stream-filter"
+        await db.flush()
+
+        filtered = b"redacted"
+        seen = {}
+
+        async def fake_enqueue_and_wait(**kwargs):
+            seen.update(kwargs["input_data"])
+            return {"approved": True, "modified_content": base64.b64encode(filtered).decode()}
+
+        monkeypatch.setattr(
+            "app.api.runtime.endpoints.files.queue_service.enqueue_and_wait", fake_enqueue_and_wait
+        )
+
+        content = b"secret content"
+        resp = await _upload(client, admin_user, collection, content)
+        assert resp.status_code == 201
+
+        assert base64.b64decode(seen["content_base64"]) == content
+        assert seen["size_bytes"] == len(content)
+
+        version = await _current_version(db, resp.json()["id"])
+        assert version.size_bytes == len(filtered)
+        assert version.hash_sha256 == hashlib.sha256(filtered).hexdigest()
+        assert await storage.read(version.storage_path) == filtered
+
+    async def test_content_filter_rejection(
+        self, client, db, admin_user, collection, storage, monkeypatch
+    ):
+        db.add(
+            Function(
+                user_id=admin_user.id,
+                namespace="test",
+                name="stream-reject",
+                code="def handler(input, context):\n    return {'approved': False}",
+                input_schema={},
+                output_schema={},
+            )
+        )
+        collection.content_filter_function = "test/stream-reject"
+        await db.flush()
+
+        async def fake_enqueue_and_wait(**kwargs):
+            return {"approved": False, "reason": "blocked"}
+
+        monkeypatch.setattr(
+            "app.api.runtime.endpoints.files.queue_service.enqueue_and_wait", fake_enqueue_and_wait
+        )
+
+        resp = await _upload(client, admin_user, collection, b"nope")
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "blocked"
+
+
+# =========================================================================
+# Deletion
+# =========================================================================
+
+
+class TestDeleteFile:
+    async def test_delete_removes_versions_evaluations_and_content(
+        self, client, db, admin_user, collection, storage
+    ):
+        resp = await _upload(client, admin_user, collection, b"first")
+        file_id = uuid.UUID(resp.json()["id"])
+        resp = await _upload(client, admin_user, collection, b"second", update_existing="true")
+        assert resp.json()["id"] == str(file_id)
+        db.add(
+            ContentFilterEvaluation(
+                file_id=file_id,
+                version_number=1,
+                function_namespace="test",
+                function_name="stream-filter",
+                result={"approved": True},
+            )
+        )
+        await db.flush()
+
+        result = await db.execute(select(FileVersion.storage_path).where(FileVersion.file_id == file_id))
+        paths = result.scalars().all()
+        assert len(paths) == 2
+
+        resp = await client.delete(
+            f"/files/{collection.namespace}/{collection.name}/data.bin",
+            headers=auth_headers(admin_user),
+        )
+        assert resp.status_code == 204
+
+        # Versions and evaluations go with the file via ON DELETE CASCADE
+        for model, column in (
+            (File, File.id),
+            (FileVersion, FileVersion.file_id),
+            (ContentFilterEvaluation, ContentFilterEvaluation.file_id),
+        ):
+            count = await db.scalar(select(func.count()).select_from(model).where(column == file_id))
+            assert count == 0, model.__name__
+        for path in paths:
+            assert not await storage.exists(path)
@@ -0,0 +1,148 @@
+"""Tests for keyset (cursor) pagination via the X-Next-Cursor header."""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.state import State
+from app.models.store import Store
+from app.models.template import Template
+from tests.conftest import auth_headers
+
+
+# ---------------------------------------------------------------------------
+# Helpers / fixtures
+# ---------------------------------------------------------------------------
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+async def _fetch_all_pages(client, url: str, user, limit: int) -> list[list[dict]]:
+    """Follow X-Next-Cursor from the first page until a page doesn't set it."""
+    pages = []
+    params = {"limit": limit}
+    while True:
+        resp = await client.get(url, params=params, headers=auth_headers(user))
+        assert resp.status_code == 200
+        pages.append(resp.json())
+        next_cursor = resp.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            return pages
+        params = {"limit": limit, "cursor": next_cursor}
+
+
+@pytest_asyncio.fixture
+async def store(db: AsyncSession, admin_user) -> Store:
+    store = Store(namespace="test", name=f"paging-{uuid.uuid4().hex[:8]}", user_id=admin_user.id)
+    db.add(store)
+    await db.flush()
+    return store
+
+
+@pytest_asyncio.fixture
+async def states(db: AsyncSession, admin_user, store) -> list[State]:
+    """Five states, newest first; the middle three share a created_at."""
+    offsets = [4, 3, 3, 3, 1]
+    rows = [
+        State(
+            user_id=admin_user.id,
+            store_id=store.id,
+            key=f"key-{i}",
+            value={"i": i},
+            created_at=BASE_TIME + timedelta(minutes=offset),
+        )
+        for i, offset in enumerate(offsets)
+    ]
+    db.add_all(rows)
+    await db.flush()
+    return sorted(rows, key=lambda s: (s.created_at, s.id), reverse=True)
+
+
+@pytest_asyncio.fixture
+async def templates(db: AsyncSession, admin_user) -> list[Template]:
+    """Four templates, three of which share a created_at."""
+    rows = [
+        Template(
+            namespace="test",
+            name=f"paging-{i}-{uuid.uuid4().hex[:6]}",
+            html_content="<p>{{ i }}</p>",
+            user_id=admin_user.id,
+            created_by=admin_user.id,
+            updated_by=admin_user.id,
+            created_at=BASE_TIME + timedelta(minutes=offset),
+        )
+        for i, offset in enumerate([2, 2, 2, 1])
+    ]
+    db.add_all(rows)
+    await db.flush()
+    return rows
+
+
+# =========================================================================
+# Store states
+# =========================================================================
+
+
+class TestStateCursorPaging:
+    async def test_cursor_pages_through_all_states(self, client, admin_user, store, states):
+        url = f"/stores/{store.namespace}/{store.name}/states"
+        pages = await _fetch_all_pages(client, url, admin_user, limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        keys = [state["key"] for page in pages for state in page]
+        assert keys == [state.key for state in states]
+
+    async def test_exact_multiple_ends_with_empty_page(self, client, admin_user, store, states):
+        url = f"/stores/{store.namespace}/{store.name}/states"
+        pages = await _fetch_all_pages(client, url, admin_user, limit=5)
+
+        assert [len(page) for page in pages] == [5, 0]
+
+    async def test_invalid_cursor_returns_400(self, client, admin_user, store):
+        resp = await client.get(
+            f"/stores/{store.namespace}/{store.name}/states",
+            params={"cursor": "not-a-cursor"},
+            headers=auth_headers(admin_user),
+        )
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Invalid cursor"
+
+    async def test_cursor_header_exposed_to_browsers(self, client, admin_user, store, states):
+        resp = await client.get(
+            f"/stores/{store.namespace}/{store.name}/states",
+            params={"limit": 1},
+            headers={**auth_headers(admin_user), "Origin": "https://app.example.com"},
+        )
+        assert resp.headers["X-Next-Cursor"]
+        exposed = resp.headers["Access-Control-Expose-Headers"].lower()
+        assert "x-next-cursor" in exposed
+        assert "etag" in exposed
+
+
+# =========================================================================
+# Templates
+# =========================================================================
+
+
+class TestTemplateCursorPaging:
+    async def test_cursor_pages_without_duplicates_or_gaps(
+        self, client, db, admin_user, templates
+    ):
+        pages = await _fetch_all_pages(client, "/api/v1/templates", admin_user, limit=2)
+        ids = [t["id"] for page in pages for t in page]
+
+        # Admins see every template, so the pages must add up to the whole table
+        result = await db.execute(
+            select(Template.id).order_by(Template.created_at.desc(), Template.id.desc())
+        )
+        assert ids == [str(row_id) for row_id in result.scalars()]
+        assert len(set(ids)) == len(ids)
+        assert {str(t.id) for t in templates} <= set(ids)
+
+    async def test_invalid_cursor_returns_400(self, client, admin_user):
+        resp = await client.get(
+            "/api/v1/templates", params={"cursor": "not-a-cursor"}, headers=auth_headers(admin_user)
+        )
+        assert resp.status_code == 400
@@ -1,6 +1,13 @@
 """Tests for the SINAS permission system."""
-
-from app.core.permissions import check_permission
+import uuid
+
+from app.core.permissions import (
+    GrantedPermissions,
+    _index_grants,
+    _resource_base,
+    check_permission,
+)
+from app.models.agent import Agent
 from tests.conftest import auth_headers
 
 
@@ -97,6 +104,144 @@ class TestCheckPermissionEdgeCases:
         assert check_permission(perms, "sinas.agents.create:own") is False
 
 
+class TestResourceBase:
+    async def test_plain_permission(self):
+        assert _resource_base("sinas.chats.read:own") == "sinas.chats"
+
+    async def test_namespaced_permission(self):
+        assert _resource_base("sinas.functions/marketing/send.execute:own") == "sinas.functions"
+
+    async def test_wildcard_base(self):
+        assert _resource_base("sinas.*:all") == "sinas"
+
+    async def test_missing_scope_is_malformed(self):
+        assert _resource_base("sinas.chats.read") is None
+
+    async def test_missing_action_is_malformed(self):
+        assert _resource_base("sinas:all") is None
+
+
+class TestIndexGrants:
+    async def test_concrete_grants_bucketed_by_base(self):
+        by_base, wildcards = _index_grants(
+            frozenset({"sinas.chats.read:own", "sinas.functions/marketing/send.execute:own"})
+        )
+        assert by_base == {
+            "sinas.chats": ("sinas.chats.read:own",),
+            "sinas.functions": ("sinas.functions/marketing/send.execute:own",),
+        }
+        assert wildcards == ()
+
+    async def test_wildcard_base_and_action_kept_separate(self):
+        grants = {"sinas.*:all", "sinas.functions.*:all"}
+        by_base, wildcards = _index_grants(frozenset(grants))
+        assert by_base == {}
+        assert set(wildcards) == grants
+
+    async def test_path_wildcards_bucketed_under_concrete_base(self):
+        by_base, wildcards = _index_grants(frozenset({"sinas.functions/*/*.execute:own"}))
+        assert by_base == {"sinas.functions": ("sinas.functions/*/*.execute:own",)}
+        assert wildcards == ()
+
+    async def test_malformed_grants_dropped(self):
+        assert _index_grants(frozenset({"sinas.chats.read", "garbage"})) == ({}, ())
+
+
+class TestGrantedPermissions:
+    async def test_index_built_once_per_dict(self, monkeypatch):
+        calls = []
+
+        def counting_index(grants):
+            calls.append(grants)
+            return _index_grants(grants)
+
+        monkeypatch.setattr("app.core.permissions._index_grants", counting_index)
+        perms = GrantedPermissions({"sinas.functions/*/*.execute:own": True, "sinas.*:all": False})
+
+        assert check_permission(perms, "sinas.functions/marketing/send.execute:own") is True
+        assert check_permission(perms, "sinas.agents.read:own") is False
+        assert check_permission(perms, "sinas.functions/sales/send.execute:own") is True
+        assert calls == [frozenset({"sinas.functions/*/*.execute:own"})]
+
+    async def test_matches_plain_dict(self):
+        grants = {
+            "sinas.*:all": False,
+            "sinas.chats.*:own": True,
+            "sinas.functions/marketing/*.execute:all": True,
+        }
+        required = [
+            "sinas.chats.read:own",
+            "sinas.chats.read:all",
+            "sinas.functions/marketing/send.execute:own",
+            "sinas.functions/sales/send.execute:own",
+            "sinas.agents.read:own",
+        ]
+        granted = GrantedPermissions(grants)
+        for perm in required:
+            assert check_permission(granted, perm) == check_permission(grants, perm)
+
+
+class TestCheckPermissionBuckets:
+    async def test_grant_for_other_resource_type_does_not_match(self):
+        perms = {"sinas.agents.read:all": True}
+        assert check_permission(perms, "sinas.chats.read:own") is False
+
+    async def test_action_wildcard_matches_longer_base_by_prefix(self):
+        # "*" actions match by prefix, so they can't be bucketed under their base
+        perms = {"sinas.functions.*:all": True}
+        assert check_permission(perms, "sinas.functions/marketing/send.execute:own") is True
+
+    async def test_scope_hierarchy_within_bucket(self):
+        perms = {"sinas.functions/marketing/send.execute:all": True}
+        assert check_permission(perms, "sinas.functions/marketing/send.execute:own") is True
+        assert check_permission(perms, "sinas.functions/sales/send.execute:own") is False
+
+    async def test_false_grants_ignored(self):
+        perms = {"sinas.*:all": False, "sinas.chats.read:all": False}
+        assert check_permission(perms, "sinas.chats.read:own") is False
+
+
+class TestCanList:
+    async def test_wildcard_grant(self):
+        assert Agent.can_list({"sinas.*:all": True}, "read") is True
+
+    async def test_own_scope_grant(self):
+        assert Agent.can_list({"sinas.agents/*/*.read:own": True}, "read") is True
+
+    async def test_namespace_grant(self):
+        assert Agent.can_list({"sinas.agents/marketing/*.read:own": True}, "read") is True
+
+    async def test_no_matching_grant(self):
+        perms = {"sinas.functions/*/*.read:all": True, "sinas.agents/*/*.read:own": False}
+        assert Agent.can_list(perms, "read") is False
+
+    async def test_other_action_does_not_count(self):
+        assert Agent.can_list({"sinas.agents/marketing/*.update:own": True}, "read") is False
+
+
+class TestAccessibleScopes:
+    async def test_exact_name_grant(self):
+        perms = {"sinas.agents/support/helper.read:own": True}
+        assert Agent._get_accessible_scopes(perms, "read") == (set(), {("support", "helper")})
+
+    async def test_namespace_wildcard_grant(self):
+        perms = {"sinas.agents/support/*.read:own": True}
+        assert Agent._get_accessible_scopes(perms, "read") == ({"support"}, set())
+
+    async def test_mixed_grants(self):
+        perms = {
+            "sinas.agents/support/*.read:own": True,
+            "sinas.agents/sales/closer.read:all": True,
+            "sinas.agents/ops/*.*:own": True,
+            "sinas.agents/hr/recruiter.update:own": True,  # other action
+            "sinas.agents/legal/*.read:own": False,
+        }
+        assert Agent._get_accessible_scopes(perms, "read") == (
+            {"support", "ops"},
+            {("sales", "closer")},
+        )
+
+
 # ---------------------------------------------------------------------------
 # 2. API-level permission checks via POST /auth/check-permissions
 # ---------------------------------------------------------------------------
@@ -228,3 +373,46 @@ class TestEndpointEnforcement:
         )
         # 201 Created or 409 if name collision — either way, not 403
         assert resp.status_code != 403
+
+
+# ---------------------------------------------------------------------------
+# 4. Scoped grants in list_with_permissions
+# ---------------------------------------------------------------------------
+
+
+class TestListWithScopedGrants:
+    async def _seed(self, db, owner):
+        """Agents owned by someone else in two fresh namespaces; returns (ns_a, ns_b)."""
+        ns_a, ns_b = f"scope-a-{uuid.uuid4().hex[:8]}", f"scope-b-{uuid.uuid4().hex[:8]}"
+        for namespace, name in [(ns_a, "x"), (ns_a, "y"), (ns_b, "z")]:
+            db.add(Agent(namespace=namespace, name=name, user_id=owner.id))
+        await db.flush()
+        return ns_a, ns_b
+
+    async def _visible(self, db, user, permissions, *namespaces):
+        agents = await Agent.list_with_permissions(
+            db=db,
+            user_id=str(user.id),
+            permissions=permissions,
+            action="read",
+            additional_filters=Agent.namespace.in_(namespaces),
+        )
+        return {(a.namespace, a.name) for a in agents}
+
+    async def test_exact_name_grant_only_exposes_that_resource(self, db, test_user, admin_user):
+        ns_a, ns_b = await self._seed(db, admin_user)
+        perms = {f"sinas.agents/{ns_a}/x.read:own": True}
+        assert await self._visible(db, test_user, perms, ns_a, ns_b) == {(ns_a, "x")}
+
+    async def test_namespace_wildcard_exposes_whole_namespace(self, db, test_user, admin_user):
+        ns_a, ns_b = await self._seed(db, admin_user)
+        perms = {f"sinas.agents/{ns_a}/*.read:own": True}
+        assert await self._visible(db, test_user, perms, ns_a, ns_b) == {(ns_a, "x"), (ns_a, "y")}
+
+    async def test_mixed_grants(self, db, test_user, admin_user):
+        ns_a, ns_b = await self._seed(db, admin_user)
+        perms = {
+            f"sinas.agents/{ns_a}/y.read:own": True,
+            f"sinas.agents/{ns_b}/*.read:own": True,
+        }
+        assert await self._visible(db, test_user, perms, ns_a, ns_b) == {(ns_a, "y"), (ns_b, "z")}
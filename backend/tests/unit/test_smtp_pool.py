@@ -0,0 +1,201 @@
+"""Tests for the pooled SMTP connections used to send email."""
+import smtplib
+from email.message import EmailMessage
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import smtp_pool
+
+
+# ---------------------------------------------------------------------------
+# Helpers / fixtures
+# ---------------------------------------------------------------------------
+
+
+class FakeSMTP(smtp_pool._SMTP):
+    """
+    Socket-less connection. Only the wire calls are faked, so the real
+    smtplib.SMTP.data (and the pool's tracking around it) still runs.
+    """
+
+    def __init__(self, alive: bool = True, drop: str | None = None):
+        self.alive = alive
+        self.drop = drop  # None, "before_data" or "after_data"
+        self.closed = False
+        self.sent: list[EmailMessage] = []
+        self._replies: list[tuple[int, bytes]] = []
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return (250, b"OK")
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+    def send_message(self, msg):
+        if self.drop == "before_data":
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self._replies = [(354, b"Go ahead"), (250, b"Queued")]
+        self.data(msg.as_bytes())
+        self.sent.append(msg)
+
+    def putcmd(self, cmd, args=""):
+        pass
+
+    def send(self, s):
+        pass
+
+    def getreply(self):
+        if self.drop == "after_data" and len(self._replies) == 1:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return self._replies.pop(0)
+
+
+@pytest.fixture
+def settings():
+    return SimpleNamespace(
+        smtp_host="smtp.example.com",
+        smtp_port=587,
+        smtp_user="mailer",
+        smtp_password="secret",
+        smtp_pool_size=4,
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    smtp_pool._pool.clear()
+    yield
+    smtp_pool._pool.clear()
+
+
+@pytest.fixture
+def connects(monkeypatch) -> list[FakeSMTP]:
+    """Fresh connections opened by the pool, in order."""
+    opened: list[FakeSMTP] = []
+
+    def _connect(settings, timeout):
+        server = FakeSMTP()
+        opened.append(server)
+        return server
+
+    monkeypatch.setattr(smtp_pool, "_connect", _connect)
+    return opened
+
+
+def _pooled(settings, server: FakeSMTP) -> FakeSMTP:
+    smtp_pool._pool.append((smtp_pool._pool_key(settings), server))
+    return server
+
+
+def _message() -> EmailMessage:
+    msg = EmailMessage()
+    msg["Subject"] = "Your login code"
+    msg["From"] = "noreply@example.com"
+    msg["To"] = "user@example.com"
+    msg.set_content("123456")
+    return msg
+
+
+# =========================================================================
+# Pooling
+# =========================================================================
+
+
+class TestPooling:
+    def test_connection_is_reused(self, settings, connects):
+        smtp_pool.send_message(settings, _message(), timeout=5)
+        smtp_pool.send_message(settings, _message(), timeout=5)
+
+        assert len(connects) == 1
+        assert len(connects[0].sent) == 2
+
+    def test_stale_connection_discarded_on_checkout(self, settings, connects):
+        stale = _pooled(settings, FakeSMTP(alive=False))
+
+        smtp_pool.send_message(settings, _message(), timeout=5)
+
+        assert stale.closed
+        assert stale.sent == []
+        assert len(connects) == 1
+        assert smtp_pool._pool[0][1] is connects[0]
+
+    def test_connection_for_other_settings_not_used(self, settings, connects):
+        other = SimpleNamespace(**{**vars(settings), "smtp_user": "someone-else"})
+        foreign = _pooled(other, FakeSMTP())
+
+        smtp_pool.send_message(settings, _message(), timeout=5)
+
+        assert foreign.closed
+        assert len(connects) == 1
+
+    def test_pool_size_cap(self, settings, connects):
+        settings.smtp_pool_size = 1
+        with smtp_pool.smtp_connection(settings, timeout=5):
+            with smtp_pool.smtp_connection(settings, timeout=5):
+                pass
+
+        assert len(connects) == 2
+        assert len(smtp_pool._pool) == 1
+        assert [server.closed for server in connects] == [True, False]
+
+    def test_pool_size_zero_disables_reuse(self, settings, connects):
+        settings.smtp_pool_size = 0
+        smtp_pool.send_message(settings, _message(), timeout=5)
+
+        assert connects[0].closed
+        assert not smtp_pool._pool
+
+    def test_connection_not_reused_after_exception(self, settings, connects):
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            with smtp_pool.smtp_connection(settings, timeout=5):
+                raise smtplib.SMTPRecipientsRefused({})
+
+        assert connects[0].closed
+        assert not smtp_pool._pool
+
+
+# =========================================================================
+# Retry on dropped connections
+# =========================================================================
+
+
+class TestRetry:
+    def test_pooled_connection_dropped_before_data_is_retried(self, settings, connects):
+        dropped = _pooled(settings, FakeSMTP(drop="before_data"))
+
+        smtp_pool.send_message(settings, _message(), timeout=5)
+
+        assert dropped.closed
+        assert len(connects) == 1
+        assert len(connects[0].sent) == 1
+
+    def test_disconnect_after_data_is_not_retried(self, settings, connects):
+        """The server may have accepted the message; resending could duplicate it."""
+        dropped = _pooled(settings, FakeSMTP(drop="after_data"))
+
+        with pytest.raises(smtplib.SMTPServerDisconnected):
+            smtp_pool.send_message(settings, _message(), timeout=5)
+
+        assert dropped.closed
+        assert connects == []
+
+    def test_fresh_connection_dropped_is_not_retried(self, settings, monkeypatch):
+        opened = []
+
+        def _connect(settings, timeout):
+            server = FakeSMTP(drop="before_data")
+            opened.append(server)
+            return server
+
+        monkeypatch.setattr(smtp_pool, "_connect", _connect)
+
+        with pytest.raises(smtplib.SMTPServerDisconnected):
+            smtp_pool.send_message(settings, _message(), timeout=5)
+
+        assert len(opened) == 1